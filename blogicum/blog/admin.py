@@ -1,6 +1,16 @@
 from django.contrib import admin
+from django.contrib.auth import get_permission_codename
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpResponseBadRequest, StreamingHttpResponse
+from django.urls import path
 from django.utils.safestring import mark_safe
 
+from core.export import EXPORT_FORMATS, export_chunks
+from core.images import image_variants_are_stale
+from core.paginator import ApproximateCountPaginator
+from core.search import search_posts
+from .exports import EXPORTS, export_rows
+from .forms import ExportForm
 from .models import Location, Category, Post, Comment
 
 admin.site.empty_value_display = "Не задано"
@@ -11,6 +21,42 @@ class BlogAdmin(admin.ModelAdmin):
     list_editable = ("is_published",)
 
 
+class InputFilter(admin.SimpleListFilter):
+    # Filters on large relations take a typed value instead of listing
+    # every related object in the sidebar.
+    template = "admin/input_filter.html"
+
+    def lookups(self, request, model_admin):
+        return ((None, None),)
+
+    def choices(self, changelist):
+        yield {
+            "query_parts": [
+                (key, value)
+                for key, value in changelist.get_filters_params().items()
+                if key != self.parameter_name
+            ],
+        }
+
+
+class AuthorFilter(InputFilter):
+    title = "автору (имя пользователя)"
+    parameter_name = "author"
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(author__username=self.value())
+
+
+class LocationFilter(InputFilter):
+    title = "местоположению"
+    parameter_name = "location"
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(location__name__icontains=self.value())
+
+
 class CommentAdmin(admin.TabularInline):
 
     model = Comment
@@ -21,6 +67,9 @@ class CommentAdmin(admin.TabularInline):
     )
     extra = 0
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("author")
+
 
 @admin.register(Post)
 class PostAdmin(BlogAdmin):
@@ -42,9 +91,13 @@ class PostAdmin(BlogAdmin):
     list_filter = (
         "is_published",
         "category",
-        "location",
-        "author",
+        LocationFilter,
+        AuthorFilter,
     )
+    list_select_related = ("author",)
+    autocomplete_fields = ("author", "location")
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
     fields = (
         "is_published",
         "title",
@@ -59,14 +112,58 @@ class PostAdmin(BlogAdmin):
     readonly_fields = ("get_post_img",)
     save_on_top = True
 
+    def get_urls(self):
+        return [
+            path(
+                "export/<str:kind>/",
+                self.admin_site.admin_view(self.export_view),
+                name="blog_post_export",
+            ),
+        ] + super().get_urls()
+
+    def export_view(self, request, kind):
+        if kind not in EXPORTS:
+            raise Http404("Неизвестная выгрузка")
+        opts = EXPORTS[kind]["model"]._meta
+        codename = get_permission_codename("view", opts)
+        if not request.user.has_perm(f"{opts.app_label}.{codename}"):
+            raise PermissionDenied
+        form = ExportForm(request.GET)
+        if not form.is_valid():
+            return HttpResponseBadRequest(form.errors.as_text())
+        data = form.cleaned_data
+        columns, rows = export_rows(
+            kind, data["date_from"], data["date_to"], data["category"]
+        )
+        _, content_type = EXPORT_FORMATS[data["format"]]
+        filename = f"{kind}.{data['format']}"
+        if data["compress"]:
+            content_type = "application/gzip"
+            filename += ".gz"
+        response = StreamingHttpResponse(
+            export_chunks(data["format"], columns, rows, data["compress"]),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        return search_posts(queryset, search_term), False
+
     @admin.display(description="Изображение")
     def get_post_img(self, obj):
         if obj.image:
-            return mark_safe(f"<img src='{obj.image.url}' width=50")
+            url = obj.image.url
+            if not image_variants_are_stale(obj):
+                thumb = obj.image_variants["sizes"]["thumb"]["name"]
+                url = obj.image.storage.url(thumb)
+            return mark_safe(f"<img src='{url}' width=50>")
 
-    @admin.display(description="Комментарии")
+    @admin.display(description="Комментарии", ordering="comment_count")
     def comment_count(self, obj):
-        return obj.comments.count()
+        return obj.comment_count
 
 
 @admin.register(Category)
@@ -88,3 +185,4 @@ class LocationAdmin(BlogAdmin):
         "is_published",
         "created_at",
     )
+    search_fields = ("name",)
@@ -0,0 +1,68 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+from core.export import EXPORT_CHUNK_SIZE
+from .models import Comment, Post
+
+EXPORTS = {
+    "posts": {
+        "model": Post,
+        "columns": {
+            "id": "id",
+            "title": "title",
+            "text": "text",
+            "pub_date": "pub_date",
+            "is_published": "is_published",
+            "author": "author__username",
+            "category": "category__slug",
+            "location": "location__name",
+            "comment_count": "comment_count",
+            "created_at": "created_at",
+        },
+        "date_field": "pub_date",
+        "category_field": "category__slug",
+    },
+    "comments": {
+        "model": Comment,
+        "columns": {
+            "id": "id",
+            "post": "post_id",
+            "author": "author__username",
+            "text": "text",
+            "created_at": "created_at",
+        },
+        "date_field": "created_at",
+        "category_field": "post__category__slug",
+    },
+}
+
+
+def _start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def export_rows(
+        kind, date_from=None, date_to=None, category=None,
+        chunk_size=EXPORT_CHUNK_SIZE,
+):
+    # Rows are plain tuples read through a server-side cursor, so the
+    # export never holds more than one chunk of them.
+    export = EXPORTS[kind]
+    queryset = export["model"].objects.order_by("pk")
+    if date_from:
+        queryset = queryset.filter(
+            **{f"{export['date_field']}__gte": _start_of_day(date_from)}
+        )
+    if date_to:
+        queryset = queryset.filter(**{
+            f"{export['date_field']}__lt":
+                _start_of_day(date_to + timedelta(days=1))
+        })
+    if category:
+        queryset = queryset.filter(**{export["category_field"]: category})
+    columns = export["columns"]
+    rows = queryset.values_list(*columns.values()).iterator(
+        chunk_size=chunk_size
+    )
+    return list(columns), rows
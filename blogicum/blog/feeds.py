@@ -0,0 +1,128 @@
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.views import View
+
+from core.cache import cache_stream, get_page_key, list_page_groups
+from core.mixins import ConditionalGetMixin
+from core.utils import (
+    get_request_object,
+    post_published_query,
+    publication_now,
+)
+from .models import Category, User
+
+FEED_LIMIT = 20
+
+
+class PostFeedView(ConditionalGetMixin, View):
+    title = "Блогикум"
+    description = "Новые публикации"
+
+    def get_page_cache_groups(self):
+        return list_page_groups("index")
+
+    def get_link(self):
+        return reverse("blog:index")
+
+    def get_queryset(self):
+        return post_published_query(publication_now(self.request))
+
+    def get_page_modified(self):
+        rows = self.get_queryset().values_list("pub_date", "updated_at")
+        return [stamp for row in rows[:FEED_LIMIT] for stamp in row]
+
+    def get(self, request, *args, **kwargs):
+        # The feed generator pulls in xml.sax and urllib.request; they are
+        # loaded with the first feed request instead of with the URLconf.
+        from core.feeds import FEED_CLASSES
+
+        feed_class = FEED_CLASSES.get(kwargs["feed_format"])
+        if feed_class is None:
+            raise Http404("Неизвестный формат ленты")
+        key = get_page_key(request, self.get_page_cache_groups())
+        content = cache.get(key)
+        if content is not None:
+            return HttpResponse(content, content_type=feed_class.content_type)
+        posts = self.get_queryset()[:FEED_LIMIT]
+        feed = feed_class(
+            title=self.title,
+            link=request.build_absolute_uri(self.get_link()),
+            description=self.description,
+            feed_url=request.build_absolute_uri(),
+            language="ru",
+            updated=datetime.fromtimestamp(self.last_modified, timezone.utc),
+        )
+        return StreamingHttpResponse(
+            cache_stream(
+                key,
+                feed.stream(self.get_items(posts)),
+                settings.FEED_CACHE_TIMEOUT,
+            ),
+            content_type=feed_class.content_type,
+        )
+
+    def get_items(self, posts):
+        for post in posts.iterator():
+            link = self.request.build_absolute_uri(
+                reverse("blog:post_detail", kwargs={"pk": post.pk})
+            )
+            yield {
+                "title": post.title,
+                "link": link,
+                "unique_id": link,
+                "description": post.text,
+                "author_name": post.author.username,
+                "pubdate": post.pub_date,
+                "updateddate": post.updated_at,
+                "categories": [post.category.title],
+            }
+
+
+class CategoryFeedView(PostFeedView):
+
+    def get_page_cache_groups(self):
+        return list_page_groups(f"category:{self.kwargs['category_slug']}")
+
+    def get_category(self):
+        return get_request_object(
+            self.request,
+            Category,
+            slug=self.kwargs["category_slug"],
+            is_published=True,
+        )
+
+    def get_link(self):
+        return reverse(
+            "blog:category_posts",
+            kwargs={"category_slug": self.kwargs["category_slug"]},
+        )
+
+    def get_queryset(self):
+        category = self.get_category()
+        self.title = f"Блогикум: {category.title}"
+        self.description = category.description
+        return super().get_queryset().filter(category=category)
+
+
+class ProfileFeedView(PostFeedView):
+
+    def get_page_cache_groups(self):
+        return list_page_groups(f"profile:{self.kwargs['username']}")
+
+    def get_link(self):
+        return reverse(
+            "blog:profile", kwargs={"username": self.kwargs["username"]}
+        )
+
+    def get_queryset(self):
+        author = get_request_object(
+            self.request, User, username=self.kwargs["username"]
+        )
+        self.title = f"Блогикум: @{author.username}"
+        self.description = f"Публикации пользователя {author.username}"
+        return super().get_queryset().filter(author=author)
@@ -29,3 +29,29 @@ class CommentEditForm(forms.ModelForm):
         widgets = {
             "text": forms.Textarea({"rows": "3"})
         }
+
+
+class ExportForm(forms.Form):
+
+    format = forms.ChoiceField(
+        label="Формат",
+        choices=(("ndjson", "NDJSON"), ("csv", "CSV")),
+        required=False,
+    )
+    compress = forms.BooleanField(label="Сжать gzip", required=False)
+    date_from = forms.DateField(label="С даты", required=False)
+    date_to = forms.DateField(label="По дату", required=False)
+    category = forms.SlugField(label="Категория", required=False)
+
+    def clean_format(self):
+        return self.cleaned_data["format"] or "ndjson"
+
+    def clean(self):
+        cleaned_data = super().clean()
+        date_from = cleaned_data.get("date_from")
+        date_to = cleaned_data.get("date_to")
+        if date_from and date_to and date_from > date_to:
+            raise forms.ValidationError(
+                "Начальная дата не может быть позже конечной."
+            )
+        return cleaned_data
@@ -0,0 +1,58 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.exports import EXPORTS, export_rows
+from blog.forms import ExportForm
+from core.export import export_chunks
+
+
+class Command(BaseCommand):
+    help = (
+        "Потоково выгружает публикации или комментарии в NDJSON или CSV,"
+        " не загружая таблицы в память."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(EXPORTS))
+        parser.add_argument("--format", default="ndjson")
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="Файл выгрузки; по умолчанию стандартный вывод.",
+        )
+        parser.add_argument("--compress", action="store_true")
+        parser.add_argument("--from", dest="date_from")
+        parser.add_argument("--to", dest="date_to")
+        parser.add_argument("--category")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        form = ExportForm({
+            name: options[name]
+            for name in ("format", "compress", "date_from", "date_to",
+                         "category")
+        })
+        if not form.is_valid():
+            raise CommandError(form.errors.as_text())
+        data = form.cleaned_data
+        columns, rows = export_rows(
+            options["kind"],
+            data["date_from"],
+            data["date_to"],
+            data["category"],
+            chunk_size=options["chunk_size"],
+        )
+        chunks = export_chunks(
+            data["format"], columns, rows, data["compress"]
+        )
+        if options["output"] == "-":
+            self.write(sys.stdout.buffer, chunks)
+        else:
+            with open(options["output"], "wb") as output:
+                self.write(output, chunks)
+
+    def write(self, output, chunks):
+        for chunk in chunks:
+            output.write(chunk)
+        output.flush()
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+from core.images import image_variants_are_stale, update_post_image_variants
+
+
+class Command(BaseCommand):
+    help = "Создаёт уменьшенные копии изображений существующих публикаций."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Пересоздать копии даже для уже обработанных изображений.",
+        )
+
+    def handle(self, *args, **options):
+        processed = failed = 0
+        posts = Post.objects.exclude(image="").order_by("pk")
+        for post in posts.iterator(chunk_size=500):
+            if not options["force"] and not image_variants_are_stale(post):
+                continue
+            if update_post_image_variants(post):
+                processed += 1
+            else:
+                failed += 1
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Обработано изображений: {processed}, ошибок: {failed}"
+            )
+        )
@@ -0,0 +1,187 @@
+import json
+import tempfile
+from pathlib import Path
+from time import monotonic
+
+from django.core import serializers
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from blog.models import Category, Comment, Location, Post, User
+from core.cache import invalidate_page_groups, post_page_groups
+from core.fixtures import iter_json_array
+
+# Models are imported in this order, so every foreign key points to a
+# row that is already in the database.
+IMPORT_MODELS = (Category, Location, User, Post, Comment)
+
+
+class Command(BaseCommand):
+    help = (
+        "Потоково загружает фикстуру в формате dumpdata (JSON) пакетами"
+        " bulk_create, не считывая файл в память целиком."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("fixture", type=Path)
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            help=(
+                "Файл контрольной точки; по умолчанию рядом с фикстурой"
+                " с суффиксом .import."
+            ),
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Начать загрузку заново, не учитывая контрольную точку.",
+        )
+
+    def handle(self, *args, **options):
+        fixture = options["fixture"]
+        if not fixture.is_file():
+            raise CommandError(f"Файл {fixture} не найден.")
+        self.using = options["database"]
+        self.batch_size = options["batch_size"]
+        self.checkpoint_path = options["checkpoint"] or fixture.with_name(
+            f"{fixture.name}.import"
+        )
+        self.source = {
+            "fixture": str(fixture.resolve()),
+            "size": fixture.stat().st_size,
+        }
+        self.progress = self.load_checkpoint(options["restart"])
+        with tempfile.TemporaryDirectory() as directory:
+            spools, skipped = self.spool(fixture, Path(directory))
+            total = 0
+            for model in IMPORT_MODELS:
+                total += self.import_model(model, spools[model])
+        connection = connections[self.using]
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(
+                no_style(), IMPORT_MODELS
+            ):
+                cursor.execute(sql)
+        call_command("recount_comments", stdout=self.stdout)
+        self.checkpoint_path.unlink(missing_ok=True)
+        self.stdout.write(self.style.SUCCESS(
+            f"Загружено строк: {total}, пропущено объектов других"
+            f" моделей: {skipped}"
+        ))
+
+    def load_checkpoint(self, restart):
+        if restart or not self.checkpoint_path.is_file():
+            return {}
+        checkpoint = json.loads(self.checkpoint_path.read_text())
+        if checkpoint["source"] != self.source:
+            raise CommandError(
+                f"Контрольная точка {self.checkpoint_path} относится к"
+                " другому файлу; запустите команду с --restart."
+            )
+        self.stdout.write(
+            f"Продолжение с контрольной точки {self.checkpoint_path}."
+        )
+        return checkpoint["progress"]
+
+    def save_checkpoint(self):
+        self.checkpoint_path.write_text(json.dumps(
+            {"source": self.source, "progress": self.progress}
+        ))
+
+    def spool(self, fixture, directory):
+        # The fixture may list posts before their authors, so the objects
+        # are first split into one file per model and then imported in
+        # dependency order.
+        labels = {model._meta.label_lower: model for model in IMPORT_MODELS}
+        spools = {
+            model: directory / model._meta.label_lower
+            for model in IMPORT_MODELS
+        }
+        files = {
+            model: path.open("w", encoding="utf-8")
+            for model, path in spools.items()
+        }
+        skipped = 0
+        try:
+            with fixture.open(encoding="utf-8") as stream:
+                for item in iter_json_array(stream):
+                    model = labels.get(item.get("model", "").lower())
+                    if model is None:
+                        skipped += 1
+                        continue
+                    files[model].write(json.dumps(item) + "\n")
+        except ValueError as error:
+            raise CommandError(f"Ошибка разбора фикстуры: {error}")
+        finally:
+            for file in files.values():
+                file.close()
+        return spools, skipped
+
+    def import_model(self, model, spool):
+        label = model._meta.label_lower
+        done = self.progress.get(label, 0)
+        if done == -1:
+            return 0
+        # Right after a resume the last batch may already be committed
+        # while the checkpoint still points before it.
+        resumed = done > 0
+        imported = 0
+        started = monotonic()
+        with spool.open(encoding="utf-8") as lines:
+            objects = serializers.deserialize(
+                "python",
+                (json.loads(line) for line in lines),
+                using=self.using,
+                ignorenonexistent=True,
+            )
+            batch = []
+            for index, deserialized in enumerate(objects):
+                if index < done:
+                    continue
+                batch.append(deserialized.object)
+                if len(batch) == self.batch_size:
+                    self.insert(model, batch, resumed)
+                    imported += len(batch)
+                    resumed = False
+                    batch = []
+                    self.report(label, done + imported, imported, started)
+            if batch:
+                self.insert(model, batch, resumed)
+                imported += len(batch)
+                self.report(label, done + imported, imported, started)
+        self.progress[label] = -1
+        self.save_checkpoint()
+        return imported
+
+    def insert(self, model, batch, ignore_conflicts):
+        label = model._meta.label_lower
+        with transaction.atomic(using=self.using):
+            model.objects.using(self.using).bulk_create(
+                batch, ignore_conflicts=ignore_conflicts
+            )
+        self.progress[label] = self.progress.get(label, 0) + len(batch)
+        self.save_checkpoint()
+        if model is Post:
+            # New posts have no pages of their own yet; only the lists
+            # they join are dropped.
+            posts = Post.objects.filter(pk__in=[post.pk for post in batch])
+            details = False
+        elif model is Comment:
+            posts = Post.objects.filter(
+                pk__in={comment.post_id for comment in batch}
+            )
+            details = True
+        else:
+            return
+        invalidate_page_groups(
+            post_page_groups(posts.using(self.using), details=details)
+        )
+
+    def report(self, label, total, imported, started):
+        rate = imported / max(monotonic() - started, 1e-6)
+        self.stdout.write(f"{label}: {total} строк, {rate:.0f} строк/с")
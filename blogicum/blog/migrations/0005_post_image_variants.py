@@ -0,0 +1,18 @@
+# Generated by Django 3.2.16 on 2026-10-18 19:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='image_variants',
+            field=models.JSONField(default=None, editable=False, null=True, verbose_name='Уменьшенные копии изображения'),
+        ),
+    ]
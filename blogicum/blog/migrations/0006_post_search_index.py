@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_post_image_variants'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                "CREATE VIRTUAL TABLE blog_post_fts USING fts5("
+                "title, text, content='blog_post', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')",
+                "INSERT INTO blog_post_fts (blog_post_fts) VALUES ('rebuild')",
+            ],
+            reverse_sql=[
+                "DROP TRIGGER IF EXISTS blog_post_fts_insert",
+                "DROP TRIGGER IF EXISTS blog_post_fts_delete",
+                "DROP TRIGGER IF EXISTS blog_post_fts_update",
+                "DROP TABLE blog_post_fts",
+            ],
+        ),
+    ]
@@ -80,12 +80,47 @@ class Post(BaseModel, BaseTitle):
         blank=True,
         verbose_name="Изображение",
     )
+    image_variants = models.JSONField(
+        null=True,
+        default=None,
+        editable=False,
+        verbose_name="Уменьшенные копии изображения",
+    )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Количество комментариев",
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Изменено",
+    )
 
     class Meta:
         verbose_name = "публикация"
         verbose_name_plural = "Публикации"
         default_related_name = "posts"
         ordering = ("-pub_date",)
+        indexes = (
+            models.Index(
+                fields=("-pub_date", "-id"),
+                condition=models.Q(is_published=True),
+                name="post_feed_idx",
+            ),
+            models.Index(
+                fields=("category", "-pub_date", "-id"),
+                condition=models.Q(is_published=True),
+                name="post_category_feed_idx",
+            ),
+            models.Index(
+                fields=("author", "-pub_date", "-id"),
+                name="post_author_feed_idx",
+            ),
+            models.Index(
+                fields=("-pub_date", "-id"),
+                name="post_pub_date_idx",
+            ),
+        )
 
     def __str__(self):
         return self.title
@@ -116,6 +151,12 @@ class Comment(models.Model):
         verbose_name_plural = "Комментарии"
         default_related_name = "comments"
         ordering = ("created_at",)
+        indexes = (
+            models.Index(
+                fields=("post", "created_at", "id"),
+                name="comment_post_created_idx",
+            ),
+        )
 
     def __str__(self):
         return f"Комментарий пользователя {self.author}"
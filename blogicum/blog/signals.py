@@ -0,0 +1,121 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import (
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from core.cache import invalidate_page_groups, post_page_groups
+from core.images import (
+    delete_variants,
+    image_variants_are_stale,
+    update_post_image_variants,
+)
+from core.search import ensure_search_triggers
+from .models import Category, Comment, Location, Post, User
+
+PAGE_CACHED_MODELS = (Post, Comment, Category, Location, User)
+
+
+@receiver(post_save, sender=Comment)
+def update_post_on_comment_save(
+        sender, instance, created, raw=False, **kwargs
+):
+    # Comments have no modification time of their own; a change to any
+    # of them moves Post.updated_at instead.
+    if raw:
+        return
+    changes = {"updated_at": timezone.now()}
+    if created:
+        changes["comment_count"] = F("comment_count") + 1
+    Post.objects.filter(pk=instance.post_id).update(**changes)
+
+
+@receiver(post_delete, sender=Comment)
+def update_post_on_comment_delete(sender, instance, **kwargs):
+    Post.objects.filter(pk=instance.post_id).update(
+        comment_count=Greatest(F("comment_count") - 1, 0),
+        updated_at=timezone.now(),
+    )
+
+
+@receiver(post_save, sender=Post)
+def update_image_variants(sender, instance, raw=False, **kwargs):
+    if not raw and image_variants_are_stale(instance):
+        update_post_image_variants(instance)
+
+
+@receiver(post_delete, sender=Post)
+def delete_image_variants(sender, instance, **kwargs):
+    if instance.image_variants:
+        delete_variants(
+            instance.image_variants["sizes"], instance.image.storage
+        )
+
+
+@receiver(post_migrate)
+def create_search_triggers(sender, using, **kwargs):
+    if sender.name == "blog":
+        ensure_search_triggers(using)
+
+
+def get_page_groups(instance):
+    # Rows related to many posts invalidate their own tokens only; post
+    # pages and list pages include those tokens in their keys.
+    if isinstance(instance, Post):
+        return post_page_groups(Post.objects.filter(pk=instance.pk))
+    if isinstance(instance, Comment):
+        return post_page_groups(Post.objects.filter(pk=instance.post_id))
+    if isinstance(instance, Category):
+        return {
+            f"category:{instance.slug}",
+            f"category-id:{instance.pk}",
+            "categories",
+        }
+    if isinstance(instance, User):
+        return {
+            f"profile:{instance.username}",
+            f"user:{instance.pk}",
+            "authors",
+        }
+    return {f"location:{instance.pk}", "locations"}
+
+
+def is_login_update(kwargs):
+    # Every login saves User.last_login, which is shown nowhere.
+    update_fields = kwargs.get("update_fields")
+    return update_fields is not None and set(update_fields) <= {"last_login"}
+
+
+def remember_previous_page_groups(sender, instance, **kwargs):
+    # Pages rendered from the previous state of the row (an old slug or
+    # an old category of a post) must be dropped as well.
+    if instance.pk and not is_login_update(kwargs):
+        previous = sender.objects.filter(pk=instance.pk).first()
+        if previous is not None:
+            instance._page_groups = get_page_groups(previous)
+
+
+def remember_page_groups(sender, instance, **kwargs):
+    instance._page_groups = get_page_groups(instance)
+
+
+def invalidate_pages(sender, instance, **kwargs):
+    if is_login_update(kwargs):
+        return
+    groups = getattr(instance, "_page_groups", set())
+    if kwargs["signal"] is post_save:
+        groups = groups | get_page_groups(instance)
+    invalidate_page_groups(groups)
+
+
+for model in PAGE_CACHED_MODELS:
+    pre_save.connect(remember_previous_page_groups, sender=model)
+    pre_delete.connect(remember_page_groups, sender=model)
+    post_save.connect(invalidate_pages, sender=model)
+    post_delete.connect(invalidate_pages, sender=model)
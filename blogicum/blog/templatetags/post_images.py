@@ -0,0 +1,37 @@
+from django import template
+from django.utils.html import format_html
+
+register = template.Library()
+
+# Post cards and the post page are rendered in a 40rem wide card.
+IMAGE_SIZES = "(max-width: 40rem) 100vw, 40rem"
+SRCSET_VARIANTS = ("card", "detail")
+
+
+@register.simple_tag
+def post_image(post, variant, css_class=""):
+    variants = post.image_variants
+    if not variants or variants["source"] != post.image.name:
+        return format_html(
+            '<img class="{}" src="{}" alt="">', css_class, post.image.url
+        )
+    storage = post.image.storage
+    sizes = variants["sizes"]
+    srcset = ", ".join(
+        f"{storage.url(sizes[name]['name'])} {sizes[name]['width']}w"
+        for name in SRCSET_VARIANTS
+    )
+    chosen = sizes[variant]
+    # Feed cards below the fold should not compete with the first paint.
+    loading = "lazy" if variant == "card" else "eager"
+    return format_html(
+        '<img class="{}" src="{}" srcset="{}" sizes="{}" width="{}"'
+        ' height="{}" alt="" loading="{}">',
+        css_class,
+        storage.url(chosen["name"]),
+        srcset,
+        IMAGE_SIZES,
+        chosen["width"],
+        chosen["height"],
+        loading,
+    )
@@ -1,6 +1,6 @@
 from django.urls import path
 
-from . import views
+from . import feeds, views
 
 app_name = "blog"
 
@@ -10,17 +10,37 @@ urlpatterns = [
         views.IndexView.as_view(),
         name="index",
     ),
+    path(
+        "feed/<str:feed_format>/",
+        feeds.PostFeedView.as_view(),
+        name="feed",
+    ),
     path(
         "category/<slug:category_slug>/",
         views.CategoryPostListView.as_view(),
         name="category_posts",
     ),
+    path(
+        "category/<slug:category_slug>/feed/<str:feed_format>/",
+        feeds.CategoryFeedView.as_view(),
+        name="category_feed",
+    ),
 
     path(
         "profile/<slug:username>/",
         views.UserPostsListView.as_view(),
         name="profile",
     ),
+    path(
+        "profile/<slug:username>/feed/<str:feed_format>/",
+        feeds.ProfileFeedView.as_view(),
+        name="profile_feed",
+    ),
+    path(
+        "search/",
+        views.PostSearchView.as_view(),
+        name="search",
+    ),
     path(
         "posts/<int:pk>/",
         views.PostDetailView.as_view(),
@@ -36,6 +56,11 @@ urlpatterns = [
         views.PostCreateView.as_view(),
         name="create_post",
     ),
+    path(
+        "posts/<int:pk>/comments/",
+        views.PostCommentsView.as_view(),
+        name="post_comments",
+    ),
     path(
         "posts/<int:pk>/edit/",
         views.PostUpdateView.as_view(),
@@ -1,8 +1,10 @@
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.core.mail import send_mail
-from django.shortcuts import get_object_or_404, redirect
+from django.core.paginator import InvalidPage
+from django.db import transaction
+from django.http import Http404
+from django.shortcuts import redirect
 from django.urls import reverse, reverse_lazy
-from django.utils.timezone import now
 from django.views.generic import (
     ListView,
     DetailView,
@@ -10,27 +12,100 @@ from django.views.generic import (
     CreateView,
     DeleteView,
 )
-from core.utils import post_all_query, post_published_query, get_post_data
-from core.mixins import CommentMixinView
+from core.utils import (
+    COMMENT_ORDERING,
+    POST_ORDERING,
+    comment_url,
+    post_all_query,
+    post_published_query,
+    get_post_data,
+    get_request_object,
+    is_post_published,
+    publication_now,
+)
+from core.mixins import (
+    AnonymousPageCacheMixin,
+    CommentMixinView,
+    ConditionalGetMixin,
+    RequestObjectMixin,
+)
+from core.cache import (
+    list_page_groups,
+    post_detail_groups,
+    set_post_card_versions,
+)
+from core.outbox import enqueue_email
+from core.paginator import CursorPaginator
+from core.search import search_posts
 from .models import Post, User, Category, Comment
 from .forms import UserEditForm, PostEditForm, CommentEditForm
 
 POST_LIMIT = 10
+COMMENT_LIMIT = 20
 
 
-class IndexView(ListView):
+class IndexView(ConditionalGetMixin, AnonymousPageCacheMixin, ListView):
     model = Post
     template_name = "blog/index.html"
-    queryset = post_published_query()
     paginate_by = POST_LIMIT
+    _pagination = None
+
+    def get_page_cache_groups(self):
+        # Only the first pages of the feed are hot enough to be worth
+        # caching; deeper cursor pages are cheap range scans anyway.
+        page = self.request.GET.get(self.page_kwarg, "1")
+        if (
+            set(self.request.GET) - {self.page_kwarg}
+            or not page.isdigit()
+            or int(page) > settings.PAGE_CACHE_INDEX_PAGES
+        ):
+            return None
+        return list_page_groups("index")
+
+    def get_queryset(self):
+        return post_published_query(publication_now(self.request))
+
+    def get_page_modified(self):
+        # Only the rows on the page: the same query then renders it.
+        _, page, _, _ = self.paginate_queryset(
+            self.get_queryset(), self.get_paginate_by(None)
+        )
+        return [
+            stamp
+            for post in page.object_list
+            for stamp in (post.pub_date, post.updated_at)
+        ]
+
+    def paginate_queryset(self, queryset, page_size):
+        if self._pagination is not None:
+            return self._pagination
+        paginator = CursorPaginator(queryset, page_size, POST_ORDERING)
+        try:
+            page = paginator.page(
+                after=self.request.GET.get("after"),
+                before=self.request.GET.get("before"),
+                number=self.request.GET.get(self.page_kwarg),
+            )
+        except InvalidPage as error:
+            raise Http404(str(error))
+        set_post_card_versions(page.object_list)
+        self._pagination = (
+            paginator, page, page.object_list, page.has_other_pages()
+        )
+        return self._pagination
 
 
 class CategoryPostListView(IndexView):
     template_name = "blog/category.html"
 
+    def get_page_cache_groups(self):
+        return list_page_groups(f"category:{self.kwargs['category_slug']}")
+
     def get_category(self):
         slug = self.kwargs["category_slug"]
-        return get_object_or_404(Category, slug=slug, is_published=True)
+        return get_request_object(
+            self.request, Category, slug=slug, is_published=True
+        )
 
     def get_queryset(self):
         category = self.get_category()
@@ -46,9 +121,14 @@ class CategoryPostListView(IndexView):
 class UserPostsListView(IndexView):
     template_name = "blog/profile.html"
 
+    def get_page_cache_groups(self):
+        return list_page_groups(f"profile:{self.kwargs['username']}")
+
     def get_author(self):
         username = self.kwargs["username"]
-        return get_object_or_404(User, username=username)
+        if self.request.user.username == username:
+            return self.request.user
+        return get_request_object(self.request, User, username=username)
 
     def get_queryset(self):
         author = self.get_author()
@@ -63,36 +143,91 @@ class UserPostsListView(IndexView):
         return context
 
 
-class PostDetailView(DetailView):
+class PostSearchView(ListView):
+    template_name = "blog/search.html"
+    paginate_by = POST_LIMIT
+
+    def get_search_query(self):
+        return self.request.GET.get("q", "").strip()
+
+    def get_queryset(self):
+        return search_posts(
+            post_published_query(publication_now(self.request)),
+            self.get_search_query(),
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator, page, object_list, is_paginated = (
+            super().paginate_queryset(queryset, page_size)
+        )
+        page.object_list = list(object_list)
+        set_post_card_versions(page.object_list)
+        return paginator, page, page.object_list, is_paginated
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["query"] = self.get_search_query()
+        return context
+
+
+class PostDetailView(
+        ConditionalGetMixin, AnonymousPageCacheMixin, DetailView
+):
     model = Post
     template_name = "blog/detail.html"
 
+    def get_page_cache_groups(self):
+        return post_detail_groups(self.kwargs["pk"], self.get_post_data)
+
     def get_post_data(self):
-        return get_object_or_404(Post, pk=self.kwargs["pk"])
+        return get_request_object(
+            self.request, post_all_query(), pk=self.kwargs["pk"]
+        )
 
-    def get_queryset(self):
+    def get_page_modified(self):
+        # Comments move Post.updated_at as well.
+        return [self.get_post_data().updated_at]
+
+    def get_object(self, queryset=None):
         post_data = self.get_post_data()
-        if post_data.author == self.request.user:
-            return post_all_query().filter(pk=post_data.pk)
-        return post_published_query().filter(pk=post_data.pk)
+        if (
+            post_data.author_id != self.request.user.id
+            and not self._check_post_data(post_data)
+        ):
+            raise Http404("Публикация не найдена")
+        return post_data
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        post_data = self.get_post_data()
+        post_data = self.object
         if self._check_post_data(post_data):
             context["flag"] = True
             context["form"] = CommentEditForm()
-        context["comments"] = post_data.comments.all().select_related("author")
+        context["comments"] = self.get_comments_page()
         return context
 
-    def _check_post_data(self, post_data):
-        return all(
-            (
-                post_data.is_published,
-                post_data.pub_date <= now(),
-                post_data.category.is_published,
+    def get_comments_page(self):
+        comments = self.object.comments.select_related("author")
+        paginator = CursorPaginator(comments, COMMENT_LIMIT, COMMENT_ORDERING)
+        # ?comment=<id> opens the page holding that comment, so a link to
+        # its anchor works however deep the comment is.
+        comment_pk = self.request.GET.get("comment", "")
+        comment = None
+        if comment_pk.isdigit():
+            comment = comments.filter(pk=comment_pk).first()
+        try:
+            return paginator.page(
+                after=self.request.GET.get("after"), containing=comment
             )
-        )
+        except InvalidPage as error:
+            raise Http404(str(error))
+
+    def _check_post_data(self, post_data):
+        return is_post_published(post_data, publication_now(self.request))
+
+
+class PostCommentsView(PostDetailView):
+    template_name = "includes/comment_list.html"
 
 
 class UserProfileUpdateView(LoginRequiredMixin, UpdateView):
@@ -122,13 +257,13 @@ class PostCreateView(LoginRequiredMixin, CreateView):
                        kwargs={"username": self.request.user.username})
 
 
-class PostUpdateView(LoginRequiredMixin, UpdateView):
+class PostUpdateView(LoginRequiredMixin, RequestObjectMixin, UpdateView):
     model = Post
     form_class = PostEditForm
     template_name = "blog/create.html"
 
     def dispatch(self, request, *args, **kwargs):
-        if self.get_object().author != request.user:
+        if self.get_object().author_id != request.user.id:
             return redirect("blog:post_detail", pk=self.kwargs["pk"])
         return super().dispatch(request, *args, **kwargs)
 
@@ -136,12 +271,12 @@ class PostUpdateView(LoginRequiredMixin, UpdateView):
         return reverse("blog:post_detail", kwargs={"pk": self.kwargs["pk"]})
 
 
-class PostDeleteView(LoginRequiredMixin, DeleteView):
+class PostDeleteView(LoginRequiredMixin, RequestObjectMixin, DeleteView):
     model = Post
     template_name = "blog/create.html"
 
     def dispatch(self, request, *args, **kwargs):
-        if self.get_object().author != request.user:
+        if self.get_object().author_id != request.user.id:
             return redirect("blog:post_detail", pk=self.kwargs["pk"])
         return super().dispatch(request, *args, **kwargs)
 
@@ -161,41 +296,46 @@ class CommentCreateView(LoginRequiredMixin, CreateView):
     template_name = "blog/comment.html"
 
     def dispatch(self, request, *args, **kwargs):
-        self.post_data = get_post_data(self.kwargs)
+        self.post_data = get_post_data(request, self.kwargs)
         return super().dispatch(request, *args, **kwargs)
 
     def form_valid(self, form):
         form.instance.author = self.request.user
         form.instance.post = self.post_data
-        if self.post_data.author != self.request.user:
-            self.send_author_email()
-        return super().form_valid(form)
+        with transaction.atomic():
+            response = super().form_valid(form)
+            if self.post_data.author != self.request.user:
+                self.send_author_email()
+        return response
 
     def get_success_url(self):
-        return reverse("blog:post_detail",
-                       kwargs={"pk": self.kwargs["pk"]})
+        return comment_url(self.object)
 
     def send_author_email(self):
         post_url = self.request.build_absolute_uri(self.get_success_url())
         recipient_email = self.post_data.author.email
+        if not recipient_email:
+            return
         subject = "Новый комментарий"
         message = (
             f"Пользователь {self.request.user} добавил "
             f"комментарий к посту {self.post_data.title}.\n"
             f"Читать комментарий {post_url}"
         )
-        send_mail(
+        enqueue_email(
             subject=subject,
             message=message,
             from_email="from@example.com",
-            recipient_list=[recipient_email],
-            fail_silently=True,
+            recipient=recipient_email,
         )
 
 
 class CommentUpdateView(CommentMixinView, UpdateView):
     form_class = CommentEditForm
 
+    def get_success_url(self):
+        return comment_url(self.object)
+
 
 class CommentDeleteView(CommentMixinView, DeleteView):
     ...
@@ -0,0 +1 @@
+from .development import *  # noqa: F401,F403
@@ -0,0 +1,222 @@
+import os
+import tempfile
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Files the running site writes for itself (the shared cache, metrics)
+# stay out of the source tree.
+RUNTIME_DIR = Path(
+    os.environ.get("BLOGICUM_RUNTIME_DIR")
+    or Path(tempfile.gettempdir()) / "blogicum"
+)
+
+SECRET_KEY = (
+    "django-insecure-xvs)n!0rbplko$bacru_9%mw!fu@nt$(yhwma-@=c%32r^x!x0"
+)
+
+DEBUG = False
+
+ALLOWED_HOSTS = [
+    "localhost",
+    "127.0.0.1",
+    "[::1]",
+]
+
+INTERNAL_IPS = [
+    "127.0.0.1",
+]
+
+INSTALLED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "blog.apps.BlogConfig",
+    "pages.apps.PagesConfig",
+    "core.apps.CoreConfig",
+    "django_bootstrap5",
+]
+
+MIDDLEWARE = [
+    "core.middleware.RequestTimingMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "core.middleware.StaticFilesMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "core.middleware.CachedAuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+ROOT_URLCONF = "blogicum.urls"
+
+TEMPLATES_DIR = BASE_DIR / "templates"
+
+TEMPLATES = [
+    {
+        "BACKEND": "core.templates.TimedDjangoTemplates",
+        "DIRS": [TEMPLATES_DIR],
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.debug",
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+            ],
+            "builtins": [
+                "django.templatetags.static",
+            ],
+        },
+    },
+]
+
+PRECOMPILE_TEMPLATES = False
+
+WSGI_APPLICATION = "blogicum.wsgi.application"
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "timeout": 20,
+        },
+    }
+}
+
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64000,
+    "mmap_size": 268435456,
+    "busy_timeout": 20000,
+    "temp_store": "MEMORY",
+}
+
+# Page cache group tokens, cached pages and post cards have to be the
+# same for every worker process, so the cache lives on disk.
+CACHES = {
+    "default": {
+        "BACKEND": "core.filecache.FileBasedCache",
+        "LOCATION": RUNTIME_DIR / "cache",
+        "OPTIONS": {
+            "MAX_ENTRIES": 20000,
+            "CULL_INTERVAL": 60,
+        },
+    }
+}
+
+PAGE_CACHE_TIMEOUT = 60
+
+PAGE_CACHE_INDEX_PAGES = 5
+
+FEED_CACHE_TIMEOUT = 30
+
+SLOW_REQUEST_MS = 500
+
+SLOW_REQUEST_TOP_QUERIES = 5
+
+REQUEST_TIMING_WINDOW = 60
+
+REQUEST_TIMING_WINDOWS = 15
+
+# Sessions live in a signed cookie, so reading one costs no query; the
+# cache backend fits as well once CACHES is shared between workers.
+SESSION_ENGINE = "django.contrib.sessions.backends.signed_cookies"
+
+USER_CACHE_TIMEOUT = 30
+
+USER_CACHE_MAX_SIZE = 1000
+
+METRICS_DB_PATH = RUNTIME_DIR / "metrics.sqlite3"
+
+METRICS_FLUSH_INTERVAL = 5
+
+# /internal/metrics answers only requests with "Authorization: Bearer
+# <METRICS_TOKEN>"; without a token the endpoint is disabled.
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+# The image backlog is counted with a table scan, at most once this often.
+METRICS_IMAGE_BACKLOG_TIMEOUT = 300
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
+    },
+]
+
+LANGUAGE_CODE = "ru-RU"
+
+TIME_ZONE = "Europe/Moscow"
+
+USE_I18N = True
+
+USE_L10N = False
+
+USE_TZ = True
+
+STATIC_URL = "/static/"
+
+STATICFILES_DIRS = [
+    BASE_DIR / "static",
+]
+
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+# Local copy of the Bootstrap stylesheet that build_css purges into
+# static/css; see README.
+BOOTSTRAP_SOURCE_CSS = BASE_DIR / "assets" / "bootstrap.min.css"
+
+# Files without a content hash in the name, e.g. collected by a storage
+# that does not hash them.
+STATIC_CACHE_MAX_AGE = 60
+
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+MEDIA_ROOT = BASE_DIR / "media"
+
+POST_IMAGE_SIZES = {
+    "thumb": 100,
+    "card": 640,
+    "detail": 1280,
+}
+
+EMAIL_BACKEND = "django.core.mail.backends.filebased.EmailBackend"
+
+EMAIL_FILE_PATH = BASE_DIR / "sent_emails"
+
+OUTBOX_BATCH_SIZE = 100
+
+OUTBOX_MAX_ATTEMPTS = 5
+
+OUTBOX_RETRY_DELAY = 60
+
+OUTBOX_MAX_RETRY_DELAY = 3600
+
+OUTBOX_LEASE = 300
+
+PUBLICATION_CLOCK_STEP = 30
+
+LOGIN_REDIRECT_URL = "blog:index"
+
+LOGIN_URL = "login"
+
+CSRF_FAILURE_VIEW = "pages.views.csrf_failure"
+
+BENCH_BUDGETS_FILE = BASE_DIR / "bench_budgets.json"
@@ -0,0 +1,43 @@
+import os
+
+from .base import *  # noqa: F401,F403
+from .base import TEMPLATES
+
+DEBUG = False
+
+# Secrets and host names come from the environment only. Without
+# DJANGO_SECRET_KEY the key is empty and Django refuses to start.
+SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY", "")
+
+ALLOWED_HOSTS = [
+    host.strip()
+    for host in os.environ.get("DJANGO_ALLOWED_HOSTS", "").split(",")
+    if host.strip()
+]
+
+# Templates are read and compiled once per process; the wsgi and asgi
+# entry points compile everything under TEMPLATES_DIR at boot.
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        "APP_DIRS": False,
+        "OPTIONS": {
+            **TEMPLATES[0]["OPTIONS"],
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
+        },
+    },
+]
+
+PRECOMPILE_TEMPLATES = True
+
+# collectstatic writes content-hashed names with gzip (and, if the brotli
+# package is installed, brotli) variants, served by StaticFilesMiddleware.
+STATICFILES_STORAGE = "core.staticfiles.CompressedManifestStaticFilesStorage"
@@ -5,6 +5,8 @@ from django.conf.urls.static import static
 from django.views.generic.edit import CreateView
 from django.contrib.auth.forms import UserCreationForm
 
+from core.views import metrics_view
+
 handler404 = "pages.views.page_not_found"
 handler500 = "pages.views.server_error"
 
@@ -12,6 +14,7 @@ urlpatterns = [
     path("", include("blog.urls", namespace="blog")),
     path("pages/", include("pages.urls", namespace="pages")),
     path("admin/", admin.site.urls),
+    path("internal/metrics", metrics_view, name="metrics"),
     path("auth/", include("django.contrib.auth.urls")),
     path(
         "auth/registration/",
@@ -24,7 +27,7 @@ urlpatterns = [
     ),
 ]
 
-if settings.DEBUG:
+if "debug_toolbar" in settings.INSTALLED_APPS:
     import debug_toolbar
 
     urlpatterns += (path("__debug__/", include(debug_toolbar.urls)),)
@@ -1,7 +1,15 @@
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "blogicum.settings")
+from core.templates import precompile_templates
+
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", "blogicum.settings.production"
+)
 
 application = get_wsgi_application()
+
+if settings.PRECOMPILE_TEMPLATES:
+    precompile_templates()
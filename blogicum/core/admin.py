@@ -0,0 +1,23 @@
+from django.contrib import admin
+
+from .models import EmailOutbox
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+
+    list_display = (
+        "subject",
+        "recipient",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+    )
+    list_filter = ("status",)
+    readonly_fields = (
+        "attempts",
+        "last_error",
+        "created_at",
+        "sent_at",
+    )
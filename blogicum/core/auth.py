@@ -0,0 +1,92 @@
+import copy
+import threading
+from time import monotonic
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib import auth
+from django.core.cache import cache
+
+VERSION_KEY_PREFIX = "user-version"
+
+_users = {}
+_lock = threading.Lock()
+
+
+def _user_key(session):
+    # A session that still carries the old auth hash keeps its key after
+    # a password change; staleness is caught by the version check below.
+    user_id = session.get(auth.SESSION_KEY)
+    if user_id is None:
+        return None
+    return (
+        str(user_id),
+        session.get(auth.BACKEND_SESSION_KEY),
+        session.get(auth.HASH_SESSION_KEY),
+    )
+
+
+def _version_key(user_id):
+    return f"{VERSION_KEY_PREFIX}:{user_id}"
+
+
+def get_user_version(user_id):
+    # A per-user token in the shared cache. Every worker compares it with
+    # the token its entry was stored under, so a save in one worker drops
+    # the user from all of them.
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def get_cached_user(request):
+    # Authenticated users are kept in memory of the worker process for
+    # USER_CACHE_TIMEOUT seconds, so a page view does not load the user.
+    key = _user_key(request.session)
+    if key is None:
+        return auth.get_user(request)
+    version = get_user_version(key[0])
+    with _lock:
+        stored, stored_version, user = _users.get(key, (None, None, None))
+    if (
+        stored is not None
+        and stored_version == version
+        and monotonic() - stored < settings.USER_CACHE_TIMEOUT
+    ):
+        # Views may change request.user, e.g. a profile form that fails
+        # validation, so every request gets its own copy.
+        return copy.copy(user)
+    user = auth.get_user(request)
+    if user.is_authenticated:
+        remember_user(key, version, user)
+    return user
+
+
+def remember_user(key, version, user):
+    now = monotonic()
+    with _lock:
+        if len(_users) >= settings.USER_CACHE_MAX_SIZE:
+            for stale_key in [
+                stale_key for stale_key, (stored, _, _) in _users.items()
+                if now - stored >= settings.USER_CACHE_TIMEOUT
+            ]:
+                del _users[stale_key]
+            if len(_users) >= settings.USER_CACHE_MAX_SIZE:
+                _users.clear()
+        _users[key] = (now, version, copy.copy(user))
+
+
+def forget_user(user_id):
+    user_id = str(user_id)
+    cache.set(_version_key(user_id), uuid4().hex, timeout=None)
+    with _lock:
+        for key in [key for key in _users if key[0] == user_id]:
+            del _users[key]
+
+
+def clear_user_cache():
+    with _lock:
+        _users.clear()
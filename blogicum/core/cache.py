@@ -0,0 +1,187 @@
+from hashlib import md5
+from time import time
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core import metrics
+from core.utils import publication_now
+
+GROUP_KEY_PREFIX = "page-group"
+PAGE_KEY_PREFIX = "page"
+VALIDATORS_KEY_PREFIX = "page-validators"
+POST_GROUPS_KEY_PREFIX = "post-groups"
+POST_GROUPS_TIMEOUT = 24 * 60 * 60
+# A category, location or author is shown on list pages next to any
+# post, so a change to one of these rows drops every list page through
+# a single shared token instead of a token per post.
+RELATED_GROUPS = ("categories", "locations", "authors")
+
+
+def _group_key(group):
+    return f"{GROUP_KEY_PREFIX}:{group}"
+
+
+def _new_version(issued=None):
+    # The token ends with the moment it was issued, which doubles as the
+    # moment a row last left the pages of the group. A token created
+    # only because none was cached records no such moment.
+    return f"{uuid4().hex}-{int(time()) if issued is None else issued}"
+
+
+def get_group_versions(groups):
+    # Every group carries a random version token; a page key is built
+    # from the tokens of its groups, so replacing a token orphans every
+    # page of that group without having to know their URLs.
+    keys = [_group_key(group) for group in groups]
+    versions = cache.get_many(keys)
+    missing = {key: _new_version(0) for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def invalidate_page_groups(groups):
+    if groups:
+        cache.set_many(
+            {_group_key(group): _new_version() for group in groups},
+            timeout=None,
+        )
+
+
+def post_card_version(post):
+    # Everything the card shows, so the fragment is reused until one of
+    # these values changes. Comments move Post.updated_at and
+    # comment_count; the related rows are compared by value.
+    category = post.category
+    location = post.location
+    shown = (
+        post.updated_at.isoformat(),
+        post.is_published,
+        post.comment_count,
+        post.image_variants,
+        category and (category.slug, category.title, category.is_published),
+        location and (location.name, location.is_published),
+        post.author.username,
+    )
+    return md5(repr(shown).encode("utf-8")).hexdigest()
+
+
+def set_post_card_versions(posts):
+    for post in posts:
+        post.card_version = post_card_version(post)
+
+
+def get_page_key(request, groups):
+    # The publication clock is part of the key, so scheduled posts show
+    # up once their time comes even though no signal announces them.
+    versions = get_group_versions(groups)
+    clock = publication_now(request).isoformat()
+    raw = "|".join([request.get_full_path(), clock, *versions])
+    return f"{PAGE_KEY_PREFIX}:{md5(raw.encode()).hexdigest()}"
+
+
+def get_page_validators(request, groups, get_modified):
+    # Validators describe the data on the page: get_modified returns the
+    # moments its rows last changed or were published, and the group
+    # tokens account for rows that left it. They are recomputed once per
+    # publication clock step, which is when a scheduled post can appear;
+    # the clock itself is not part of them.
+    versions = get_group_versions(groups)
+    raw = "|".join([
+        request.get_full_path(),
+        str(request.user.pk),
+        *versions,
+    ])
+    clock = publication_now(request).isoformat()
+    key = md5(f"{raw}|{clock}".encode()).hexdigest()
+    key = f"{VALIDATORS_KEY_PREFIX}:{key}"
+    validators = cache.get(key)
+    if validators is None:
+        stamps = [stamp for stamp in get_modified() if stamp is not None]
+        raw = "|".join([raw, *(stamp.isoformat() for stamp in stamps)])
+        last_modified = max(
+            0,
+            *(int(stamp.timestamp()) for stamp in stamps),
+            *(int(version.rsplit("-", 1)[1]) for version in versions),
+        )
+        validators = (md5(raw.encode()).hexdigest(), last_modified)
+        cache.set(key, validators, settings.PAGE_CACHE_TIMEOUT)
+    return validators
+
+
+def cache_stream(key, chunks, timeout):
+    # A streamed body is stored only once it has been sent to the end.
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    cache.set(key, b"".join(parts), timeout)
+
+
+def is_page_cacheable(request):
+    return (
+        settings.PAGE_CACHE_TIMEOUT
+        and request.method == "GET"
+        and not request.user.is_authenticated
+    )
+
+
+def count_page_cache(outcome):
+    metrics.inc("page_cache_requests_total", outcome=outcome)
+
+
+def page_cache_stats():
+    # Read from the metrics store, which sums the counters of every
+    # worker process.
+    stats = {"hits": 0, "misses": 0}
+    for name, labels, value in metrics.read_metrics():
+        if name == "page_cache_requests_total":
+            stats[labels["outcome"]] = int(value)
+    return stats
+
+
+def list_page_groups(group):
+    return [group, *RELATED_GROUPS]
+
+
+def post_detail_groups(pk, get_post):
+    # A post page depends on its post and on the category, location and
+    # author rows shown with it. Which rows those are is cached together
+    # with the post token, so a cached page is found without a query;
+    # otherwise get_post loads the post the view is about to show anyway.
+    post_group = f"post:{pk}"
+    version, = get_group_versions([post_group])
+    key = f"{POST_GROUPS_KEY_PREFIX}:{pk}"
+    cached = cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    post = get_post()
+    groups = [post_group, f"user:{post.author_id}"]
+    if post.category_id:
+        groups.append(f"category-id:{post.category_id}")
+    if post.location_id:
+        groups.append(f"location:{post.location_id}")
+    cache.set(key, (version, groups), POST_GROUPS_TIMEOUT)
+    return groups
+
+
+def post_page_groups(posts, details=True):
+    # details=False leaves out the pages of the posts themselves, e.g.
+    # for posts that have just been created.
+    groups = set()
+    fields = ["category__slug", "author__username"]
+    if details:
+        fields.append("id")
+    rows = posts.order_by().values_list(*fields).distinct()
+    for category_slug, username, *post_id in rows:
+        if post_id:
+            groups.add(f"post:{post_id[0]}")
+        groups.add(f"profile:{username}")
+        if category_slug:
+            groups.add(f"category:{category_slug}")
+    if groups:
+        groups.add("index")
+    return groups
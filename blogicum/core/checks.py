@@ -0,0 +1,13 @@
+from django.contrib.staticfiles import finders
+from django.core.checks import Error, Tags, register
+
+from core.css import CRITICAL_CSS, MISSING_CSS, SITE_CSS
+
+
+@register(Tags.staticfiles, deploy=True)
+def check_site_css(app_configs, **kwargs):
+    # Pages cannot be rendered without the output of build_css. Only
+    # check --deploy runs this, so build_css itself is never blocked.
+    if finders.find(SITE_CSS) and finders.find(CRITICAL_CSS):
+        return []
+    return [Error(MISSING_CSS, id="core.E001")]
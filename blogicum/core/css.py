@@ -0,0 +1,137 @@
+import re
+
+# Like PurgeCSS: every word found in templates and code counts as a
+# possibly used class name, which errs on the side of keeping a rule.
+WORD = re.compile(r"[\w-]+")
+COMMENT = re.compile(r"/\*.*?\*/", re.S)
+LICENSE_COMMENT = re.compile(r"/\*!.*?\*/", re.S)
+CLASS_SELECTOR = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+NEGATION = re.compile(r":not\([^()]*\)")
+KEYFRAMES = re.compile(r"@(?:-webkit-)?keyframes\s+([\w-]+)")
+GROUPING_AT_RULES = ("@media", "@supports", "@layer", "@container")
+
+# Static names written by build_css and linked by {% site_css %}.
+SITE_CSS = "css/bootstrap.css"
+CRITICAL_CSS = "css/critical.css"
+MISSING_CSS = (
+    f"Нет собранных стилей {SITE_CSS} и {CRITICAL_CSS}; выполните"
+    " manage.py build_css --download или build_css --source <путь>."
+)
+
+
+def content_words(texts):
+    words = set()
+    for text in texts:
+        words.update(WORD.findall(text))
+    return words
+
+
+def _block_end(css, start):
+    # Index right after the brace closing the block opened at start.
+    depth = 0
+    quote = None
+    index = start
+    while index < len(css):
+        char = css[index]
+        if quote:
+            if char == "\\":
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    raise ValueError("Незакрытый блок в таблице стилей.")
+
+
+def parse_stylesheet(css):
+    # [(prelude, body)] of the top level; body is None for statements
+    # such as @charset, and the raw inner text for blocks.
+    css = COMMENT.sub("", css)
+    rules = []
+    position = 0
+    while css[position:].strip():
+        brace = css.find("{", position)
+        semicolon = css.find(";", position)
+        if semicolon != -1 and (brace == -1 or semicolon < brace):
+            rules.append((css[position:semicolon + 1].strip(), None))
+            position = semicolon + 1
+            continue
+        end = _block_end(css, brace)
+        rules.append((css[position:brace].strip(), css[brace + 1:end - 1]))
+        position = end
+    return rules
+
+
+def split_selectors(prelude):
+    selectors = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and not depth:
+            selectors.append(prelude[start:index].strip())
+            start = index + 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+
+def selector_is_used(selector, words):
+    # Classes inside :not() do not have to be present for a match.
+    return all(
+        name in words
+        for name in CLASS_SELECTOR.findall(NEGATION.sub("", selector))
+    )
+
+
+def _purge_rules(css, words):
+    output = []
+    for prelude, body in parse_stylesheet(css):
+        if body is None:
+            output.append(prelude)
+        elif prelude.startswith(GROUPING_AT_RULES):
+            inner = _purge_rules(body, words)
+            if inner:
+                output.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            output.append(f"{prelude}{{{body}}}")
+        else:
+            selectors = [
+                selector for selector in split_selectors(prelude)
+                if selector_is_used(selector, words)
+            ]
+            if selectors:
+                output.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(output)
+
+
+def _drop_unused_keyframes(css):
+    referenced = set(WORD.findall(KEYFRAMES.sub("", css)))
+    kept = []
+    for prelude, body in parse_stylesheet(css):
+        match = KEYFRAMES.match(prelude)
+        if match and match.group(1) not in referenced:
+            continue
+        kept.append(prelude if body is None else f"{prelude}{{{body}}}")
+    return "".join(kept)
+
+
+def purge_css(css, words):
+    # Keeps the rules whose selectors use only the given class names,
+    # together with element rules, custom properties and license notes.
+    banner = "".join(LICENSE_COMMENT.findall(css))
+    purged = _drop_unused_keyframes(_purge_rules(css, words))
+    charset = ""
+    if purged.startswith("@charset"):
+        charset, purged = purged.split(";", 1)
+        charset += ";"
+    return charset + banner + purged
@@ -0,0 +1,16 @@
+import sqlite3
+
+
+def apply_sqlite_pragmas(raw_connection, pragmas):
+    # Pragmas go straight to the driver connection, so they are neither
+    # logged nor counted as queries of the request that opened it.
+    for name, value in pragmas.items():
+        raw_connection.execute(f"PRAGMA {name} = {value}")
+
+
+def sqlite_connection_is_alive(raw_connection):
+    try:
+        raw_connection.execute("SELECT 1")
+    except sqlite3.Error:
+        return False
+    return True
@@ -0,0 +1,63 @@
+import csv
+import io
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_CHUNK_SIZE = 2000
+
+_encoder = DjangoJSONEncoder(ensure_ascii=False)
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_ndjson(columns, rows, chunk_size=EXPORT_CHUNK_SIZE):
+    for batch in _batches(rows, chunk_size):
+        yield "".join(
+            _encoder.encode(dict(zip(columns, row))) + "\n" for row in batch
+        ).encode("utf-8")
+
+
+def iter_csv(columns, rows, chunk_size=EXPORT_CHUNK_SIZE):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for batch in _batches(rows, chunk_size):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks):
+    # Each chunk is compressed as soon as it is produced; the gzip header
+    # and trailer come from the same compressor (wbits 16 + 15).
+    compressor = zlib.compressobj(wbits=31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+EXPORT_FORMATS = {
+    "ndjson": (iter_ndjson, "application/x-ndjson"),
+    "csv": (iter_csv, "text/csv"),
+}
+
+
+def export_chunks(export_format, columns, rows, compress=False):
+    writer, _ = EXPORT_FORMATS[export_format]
+    chunks = writer(columns, rows)
+    return gzip_chunks(chunks) if compress else chunks
@@ -0,0 +1,64 @@
+from io import StringIO
+
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+from django.utils.xmlutils import SimplerXMLGenerator
+
+
+class StreamingFeedMixin:
+    # Writes the same document as write(), but yields it entry by entry,
+    # so items can come straight from a database cursor.
+    item_element = None
+
+    def latest_post_date(self):
+        return self.feed["updated"]
+
+    def stream(self, items):
+        buffer = StringIO()
+        handler = SimplerXMLGenerator(buffer, "utf-8")
+        handler.startDocument()
+        self.start_root(handler)
+        self.add_root_elements(handler)
+        yield self._drain(buffer)
+        for item in items:
+            self.add_item(**item)
+            item = self.items.pop()
+            handler.startElement(self.item_element, self.item_attributes(item))
+            self.add_item_elements(handler, item)
+            handler.endElement(self.item_element)
+            yield self._drain(buffer)
+        self.end_root(handler)
+        yield self._drain(buffer)
+
+    def _drain(self, buffer):
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk.encode("utf-8")
+
+
+class StreamingAtomFeed(StreamingFeedMixin, Atom1Feed):
+    item_element = "entry"
+
+    def start_root(self, handler):
+        handler.startElement("feed", self.root_attributes())
+
+    def end_root(self, handler):
+        handler.endElement("feed")
+
+
+class StreamingRssFeed(StreamingFeedMixin, Rss201rev2Feed):
+    item_element = "item"
+
+    def start_root(self, handler):
+        handler.startElement("rss", self.rss_attributes())
+        handler.startElement("channel", self.root_attributes())
+
+    def end_root(self, handler):
+        self.endChannelElement(handler)
+        handler.endElement("rss")
+
+
+FEED_CLASSES = {
+    "atom": StreamingAtomFeed,
+    "rss": StreamingRssFeed,
+}
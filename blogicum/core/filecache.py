@@ -0,0 +1,24 @@
+from time import monotonic
+
+from django.core.cache.backends import filebased
+
+
+class FileBasedCache(filebased.FileBasedCache):
+    # Django lists the whole cache directory on every write to decide
+    # whether to cull, so a write costs O(entries). Here the directory is
+    # listed at most once per CULL_INTERVAL seconds in each process, and
+    # MAX_ENTRIES may be overshot by the writes made in between.
+
+    def __init__(self, dir, params):
+        super().__init__(dir, params)
+        self._cull_interval = params.get("OPTIONS", {}).get(
+            "CULL_INTERVAL", 60
+        )
+        self._next_cull = 0
+
+    def _cull(self):
+        now = monotonic()
+        if now < self._next_cull:
+            return
+        self._next_cull = now + self._cull_interval
+        super()._cull()
@@ -0,0 +1,43 @@
+import json
+
+FIXTURE_CHUNK_SIZE = 1024 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+def _next_char(stream, buffer, position, chunk_size):
+    # Skips whitespace, reading further chunks when the buffer runs out.
+    while True:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        if position < len(buffer):
+            return buffer, position
+        buffer, position = stream.read(chunk_size), 0
+        if not buffer:
+            raise ValueError("Фикстура обрывается до конца массива.")
+
+
+def iter_json_array(stream, chunk_size=FIXTURE_CHUNK_SIZE):
+    # Decodes the objects of a top-level JSON array one at a time, so a
+    # fixture of any size is read with a buffer of a few chunks.
+    buffer, position = _next_char(stream, "", 0, chunk_size)
+    if buffer[position] != "[":
+        raise ValueError("Фикстура должна быть массивом JSON.")
+    position += 1
+    while True:
+        buffer, position = _next_char(stream, buffer, position, chunk_size)
+        if buffer[position] == "]":
+            return
+        if buffer[position] == ",":
+            position += 1
+            continue
+        try:
+            item, position = _decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                raise
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+        yield item
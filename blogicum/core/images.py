@@ -0,0 +1,95 @@
+import logging
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db.models import F, Q
+
+from blog.models import Post
+
+JPEG_QUALITY = 85
+
+logger = logging.getLogger(__name__)
+
+
+def _has_alpha(image):
+    return "A" in image.getbands() or "transparency" in image.info
+
+
+def make_variants(field_file, sizes):
+    # Derived images are written next to the original under derived/ and
+    # are never upscaled, so a small upload simply yields small variants.
+    # Pillow is imported here: most workers never process an upload.
+    from PIL import Image, ImageOps
+
+    with field_file.open("rb") as source:
+        image = Image.open(source)
+        image.load()
+    image = ImageOps.exif_transpose(image)
+    if _has_alpha(image):
+        image_format, extension = "PNG", "png"
+        image = image.convert("RGBA")
+    else:
+        image_format, extension = "JPEG", "jpg"
+        image = image.convert("RGB")
+    path = PurePosixPath(field_file.name)
+    variants = {}
+    for name, width in sizes.items():
+        variant = image.copy()
+        variant.thumbnail((width, width * 4), Image.Resampling.LANCZOS)
+        buffer = BytesIO()
+        variant.save(
+            buffer, image_format, quality=JPEG_QUALITY, optimize=True
+        )
+        stored = field_file.storage.save(
+            f"{path.parent}/derived/{path.stem}_{width}w.{extension}",
+            ContentFile(buffer.getvalue()),
+        )
+        variants[name] = {
+            "name": stored,
+            "width": variant.width,
+            "height": variant.height,
+        }
+    return variants
+
+
+def delete_variants(variants, storage):
+    for variant in variants.values():
+        storage.delete(variant["name"])
+
+
+def image_variants_are_stale(post):
+    variants = post.image_variants
+    if not post.image:
+        return variants is not None
+    return not variants or variants["source"] != post.image.name
+
+
+def stale_image_variants_filter():
+    # The same condition as image_variants_are_stale, as a query filter.
+    return Q(image="", image_variants__isnull=False) | (
+        ~Q(image="") & (
+            Q(image_variants__isnull=True)
+            | ~Q(image_variants__source=F("image"))
+        )
+    )
+
+
+def update_post_image_variants(post):
+    previous = (post.image_variants or {}).get("sizes", {})
+    variants = None
+    if post.image:
+        try:
+            sizes = make_variants(post.image, settings.POST_IMAGE_SIZES)
+        except (OSError, ValueError) as error:
+            logger.warning(
+                "Не удалось обработать изображение публикации %s: %s",
+                post.pk, error,
+            )
+            return False
+        variants = {"source": post.image.name, "sizes": sizes}
+    delete_variants(previous, post.image.storage)
+    Post.objects.filter(pk=post.pk).update(image_variants=variants)
+    post.image_variants = variants
+    return True
@@ -0,0 +1,174 @@
+import json
+import re
+from pathlib import Path
+from statistics import median, quantiles
+from time import perf_counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+
+from blog.models import Comment, Post, User
+from core.utils import post_published_query
+
+BENCH_NAMESPACES = ("blog", "pages")
+
+
+def iter_routes(patterns, namespace=None):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_routes(
+                pattern.url_patterns, pattern.namespace or namespace
+            )
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            if namespace in BENCH_NAMESPACES:
+                yield f"{namespace}:{pattern.name}", pattern.pattern
+
+
+def percentile(timings, percent):
+    if len(timings) < 2:
+        return timings[0]
+    return quantiles(timings, n=100, method="inclusive")[percent - 1]
+
+
+def check_budgets(results, budgets):
+    violations = []
+    for name, result in results.items():
+        budget = budgets.get(name, {})
+        for metric in ("p50_ms", "p95_ms", "queries"):
+            if metric in budget and result[metric] > budget[metric]:
+                violations.append(
+                    f"{name}: {metric} = {result[metric]},"
+                    f" бюджет {budget[metric]}"
+                )
+    return violations
+
+
+class Command(BaseCommand):
+    help = (
+        "Замеряет задержку (p50/p95) и число SQL-запросов для каждого"
+        " адреса приложений blog и pages и сверяет их с бюджетами."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=5)
+        parser.add_argument(
+            "--report",
+            type=Path,
+            default=Path("bench_report.json"),
+            help="Файл, в который записывается отчёт в формате JSON.",
+        )
+        parser.add_argument(
+            "--budgets",
+            type=Path,
+            default=settings.BENCH_BUDGETS_FILE,
+            help="Файл с бюджетами задержки и числа запросов.",
+        )
+
+    def handle(self, *args, **options):
+        budgets = json.loads(options["budgets"].read_text(encoding="utf-8"))
+        cache.clear()
+        # Requests are made by the post author, so login-only pages can be
+        # measured and the anonymous page cache does not hide the work.
+        with transaction.atomic(), override_settings(
+            DEBUG=False, ALLOWED_HOSTS=["testserver"]
+        ):
+            client, kwargs, requests = self.prepare()
+            results = {
+                name: self.measure(
+                    client, reverse(name, kwargs=self.route_kwargs(
+                        pattern, kwargs
+                    )), options["repeat"], options["warmup"],
+                    *requests.get(name, ("get", None)),
+                )
+                for name, pattern in iter_routes(get_resolver().url_patterns)
+            }
+            transaction.set_rollback(True)
+        violations = check_budgets(results, budgets)
+        report = {
+            "created_at": timezone.now().isoformat(),
+            "dataset": {
+                "users": User.objects.count(),
+                "posts": Post.objects.count(),
+                "comments": Comment.objects.count(),
+            },
+            "repeat": options["repeat"],
+            "endpoints": results,
+            "violations": violations,
+        }
+        options["report"].write_text(
+            json.dumps(report, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        for name, result in results.items():
+            if name not in budgets:
+                self.stderr.write(f"Для {name} не задан бюджет.")
+            self.stdout.write(
+                f"{name}: p50 {result['p50_ms']} мс,"
+                f" p95 {result['p95_ms']} мс,"
+                f" запросов {result['queries']}"
+            )
+        if violations:
+            raise CommandError(
+                "Превышены бюджеты:\n" + "\n".join(violations)
+            )
+
+    def prepare(self):
+        post = post_published_query().filter(comment_count__gt=0).first()
+        if post is None:
+            raise CommandError(
+                "Нет опубликованных публикаций с комментариями;"
+                " заполните базу командой seed_bench_data."
+            )
+        comment = post.comments.filter(author=post.author).first()
+        if comment is None:
+            comment = Comment.objects.create(
+                post=post, author=post.author, text="Комментарий автора"
+            )
+        client = Client()
+        client.force_login(post.author)
+        kwargs = {
+            "pk": post.pk,
+            "comment_pk": comment.pk,
+            "category_slug": post.category.slug,
+            "username": post.author.username,
+            "feed_format": "atom",
+        }
+        # Routes whose work is done only for a query or a form submission
+        # are measured with one; the rest are plain GET requests.
+        requests = {
+            "blog:search": (
+                "get", {"q": max(re.findall(r"\w+", post.title), key=len)}
+            ),
+            "blog:add_comment": ("post", {"text": "Комментарий для замера"}),
+        }
+        return client, kwargs, requests
+
+    def route_kwargs(self, pattern, kwargs):
+        return {name: kwargs[name] for name in pattern.converters}
+
+    def measure(self, client, url, repeat, warmup, method="get", data=None):
+        send = getattr(client, method)
+        for _ in range(warmup):
+            send(url, data)
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                started = perf_counter()
+                response = send(url, data)
+                timings.append((perf_counter() - started) * 1000)
+        return {
+            "url": url,
+            "method": method.upper(),
+            "data": data,
+            "status": response.status_code,
+            "p50_ms": round(median(timings), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "queries": len(queries),
+        }
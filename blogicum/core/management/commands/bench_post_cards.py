@@ -0,0 +1,72 @@
+from time import perf_counter
+from uuid import uuid4
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django.utils import timezone
+
+from blog.models import Category, Post, User
+from core.cache import set_post_card_versions
+from core.paginator import CursorPaginator
+from core.utils import POST_ORDERING, post_all_query
+
+N_CARDS = 10
+
+
+class Command(BaseCommand):
+    help = (
+        "Замеряет время отрисовки страницы из 10 карточек публикаций"
+        " с холодным и прогретым кешем фрагментов."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.create_posts()
+            page = CursorPaginator(
+                post_all_query(), N_CARDS, POST_ORDERING
+            ).page()
+            request = RequestFactory().get("/")
+            request.user = AnonymousUser()
+            cold = self.measure(page, request, options["repeat"], cold=True)
+            warm = self.measure(page, request, options["repeat"], cold=False)
+            transaction.set_rollback(True)
+        self.stdout.write(
+            f"Холодный кеш: {cold:.3f} мс на страницу\n"
+            f"Прогретый кеш: {warm:.3f} мс на страницу\n"
+            f"Ускорение: {cold / warm:.1f}x"
+        )
+
+    def create_posts(self):
+        author = User.objects.create(username=f"bench-{uuid4().hex[:8]}")
+        category = Category.objects.create(
+            title="Бенчмарк", description="Бенчмарк",
+            slug=f"bench-{uuid4().hex[:8]}",
+        )
+        Post.objects.bulk_create(
+            Post(
+                title=f"Публикация {i}",
+                text="Текст публикации для замера отрисовки карточки " * 20,
+                pub_date=timezone.now(),
+                author=author,
+                category=category,
+            )
+            for i in range(N_CARDS)
+        )
+
+    def measure(self, page, request, repeat, cold):
+        set_post_card_versions(page.object_list)
+        context = {"page_obj": page}
+        render_to_string("blog/index.html", context, request=request)
+        started = perf_counter()
+        for _ in range(repeat):
+            if cold:
+                for post in page.object_list:
+                    post.card_version = uuid4().hex
+            render_to_string("blog/index.html", context, request=request)
+        return (perf_counter() - started) * 1000 / repeat
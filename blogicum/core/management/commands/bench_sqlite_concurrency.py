@@ -0,0 +1,132 @@
+import multiprocessing
+import sqlite3
+import tempfile
+from pathlib import Path
+from time import monotonic
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from blog.models import Comment, Post
+from core.db import apply_sqlite_pragmas
+from core.utils import post_published_query
+
+DEFAULT_PRAGMAS = {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+
+def run_worker(role, path, pragmas, duration, statements, results):
+    raw_connection = sqlite3.connect(path, isolation_level=None)
+    apply_sqlite_pragmas(raw_connection, pragmas)
+    done = errors = 0
+    deadline = monotonic() + duration
+    while monotonic() < deadline:
+        try:
+            if role == "reader":
+                raw_connection.execute(*statements[0]).fetchall()
+            else:
+                raw_connection.execute("BEGIN")
+                for statement in statements:
+                    raw_connection.execute(*statement)
+                raw_connection.execute("COMMIT")
+            done += 1
+        except sqlite3.OperationalError:
+            if raw_connection.in_transaction:
+                raw_connection.execute("ROLLBACK")
+            errors += 1
+    raw_connection.close()
+    results.put((role, done, errors))
+
+
+class Command(BaseCommand):
+    help = (
+        "Сравнивает пропускную способность чтения ленты и записи"
+        " комментариев на копии базы данных SQLite с настройками"
+        " по умолчанию и с SQLITE_PRAGMAS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--readers", type=int, default=4)
+        parser.add_argument("--writers", type=int, default=2)
+        parser.add_argument("--duration", type=float, default=5)
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("Команда работает только с SQLite.")
+        post = post_published_query().first()
+        if post is None:
+            raise CommandError(
+                "Нет опубликованных публикаций; заполните базу командой"
+                " seed_bench_data."
+            )
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "bench.sqlite3")
+            source = sqlite3.connect(connection.settings_dict["NAME"])
+            target = sqlite3.connect(path)
+            source.backup(target)
+            source.close()
+            target.close()
+            for title, pragmas in (
+                ("По умолчанию", DEFAULT_PRAGMAS),
+                ("SQLITE_PRAGMAS", settings.SQLITE_PRAGMAS),
+            ):
+                reads, writes, errors = self.run(
+                    path, pragmas, self.statements(post), options
+                )
+                duration = options["duration"]
+                self.stdout.write(
+                    f"{title}: чтений {reads / duration:.0f}/с,"
+                    f" записей {writes / duration:.0f}/с,"
+                    f" ошибок блокировки {errors}"
+                )
+
+    def statements(self, post):
+        feed = post_published_query()[:10].query.sql_with_params()
+        created_at = connection.ops.adapt_datetimefield_value(timezone.now())
+        return {
+            "reader": [(feed[0].replace("%s", "?"), feed[1])],
+            "writer": [
+                (
+                    f"INSERT INTO {Comment._meta.db_table}"
+                    " (text, post_id, author_id, created_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    ("Комментарий", post.pk, post.author_id, created_at),
+                ),
+                (
+                    f"UPDATE {Post._meta.db_table}"
+                    " SET comment_count = comment_count + 1 WHERE id = ?",
+                    (post.pk,),
+                ),
+            ],
+        }
+
+    def run(self, path, pragmas, statements, options):
+        # The journal mode is stored in the database file, so it is set
+        # once before the workers start.
+        setup = sqlite3.connect(path)
+        setup.execute(f"PRAGMA journal_mode = {pragmas['journal_mode']}")
+        setup.close()
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        roles = (
+            ["reader"] * options["readers"] + ["writer"] * options["writers"]
+        )
+        workers = [
+            context.Process(target=run_worker, args=(
+                role, path, pragmas, options["duration"],
+                statements[role], results,
+            ))
+            for role in roles
+        ]
+        for worker in workers:
+            worker.start()
+        totals = {"reader": 0, "writer": 0}
+        errors = 0
+        for _ in workers:
+            role, done, failed = results.get()
+            totals[role] += done
+            errors += failed
+        for worker in workers:
+            worker.join()
+        return totals["reader"], totals["writer"], errors
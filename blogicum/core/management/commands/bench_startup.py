@@ -0,0 +1,140 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from statistics import median
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.utils import get_random_secret_key
+
+# Runs in a fresh interpreter: boots the WSGI application the way a
+# worker does and serves a single request.
+BOOT_SCRIPT = """
+import json, sys, time
+from wsgiref.util import setup_testing_defaults
+started = time.perf_counter()
+from blogicum.wsgi import application
+booted = time.perf_counter()
+from django.apps import apps
+environ = {"PATH_INFO": sys.argv[1]}
+setup_testing_defaults(environ)
+statuses = []
+b"".join(application(environ, lambda status, *args: statuses.append(status)))
+print(json.dumps({
+    "boot_ms": (booted - started) * 1000,
+    "first_request_ms": (time.perf_counter() - booted) * 1000,
+    "status": statuses[0],
+    "apps": [app.name for app in apps.get_app_configs()],
+}))
+"""
+
+
+def module_group(module, app_names):
+    # Modules are charged to the installed app that contains them, then
+    # to Django itself, the standard library or a third-party package.
+    for name in app_names:
+        if module == name or module.startswith(f"{name}."):
+            return name
+    top = module.split(".")[0]
+    if top == "django":
+        return "django"
+    if top in sys.stdlib_module_names or top.startswith("_"):
+        return "stdlib"
+    return top
+
+
+def parse_importtime(stderr, app_names):
+    groups = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line[len("import time:"):].split("|")
+        groups[module_group(module.strip(), app_names)] += int(self_us)
+    return groups
+
+
+class Command(BaseCommand):
+    help = (
+        "Замеряет запуск рабочего процесса: время импорта по приложениям"
+        " (как -X importtime) и время до первого обслуженного запроса."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--path", default="/")
+        parser.add_argument("--top", type=int, default=15)
+        parser.add_argument(
+            "--settings-module",
+            default="blogicum.settings.production",
+            help="Настройки, с которыми запускается рабочий процесс.",
+        )
+
+    def handle(self, *args, **options):
+        runs = [
+            self.boot(options, importtime=False)
+            for _ in range(options["runs"])
+        ]
+        profile, stderr = self.boot(options, importtime=True)
+        groups = parse_importtime(
+            stderr,
+            sorted(profile["apps"], key=len, reverse=True),
+        )
+        total = sum(groups.values())
+        self.stdout.write(f"Ответ на {options['path']}: {profile['status']}")
+        if profile["status"][0] not in "23":
+            self.stderr.write(
+                "Первый запрос завершился ошибкой, замер не отражает"
+                " обычный путь запроса."
+            )
+        self.stdout.write(
+            f"Импорт модулей: {total / 1000:.1f} мс (с -X importtime)"
+        )
+        for group, self_us in sorted(
+            groups.items(), key=lambda item: -item[1]
+        )[:options["top"]]:
+            self.stdout.write(
+                f"  {group}: {self_us / 1000:.1f} мс"
+                f" ({self_us / total:.0%})"
+            )
+        for title, key in (
+            ("Процесс до первого ответа", "total_ms"),
+            ("Загрузка WSGI-приложения", "boot_ms"),
+            ("Первый запрос", "first_request_ms"),
+        ):
+            self.stdout.write(
+                f"{title}: {median(run[key] for run, _ in runs):.1f} мс"
+                f" (медиана из {len(runs)})"
+            )
+
+    def boot(self, options, importtime):
+        command = [sys.executable]
+        if importtime:
+            command += ["-X", "importtime"]
+        command += ["-c", BOOT_SCRIPT, options["path"]]
+        # The throwaway worker gets a key and the host of its single
+        # request unless the environment provides production values.
+        environ = {
+            "DJANGO_SECRET_KEY": get_random_secret_key(),
+            "DJANGO_ALLOWED_HOSTS": "127.0.0.1",
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": options["settings_module"],
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, (str(settings.BASE_DIR),
+                              os.environ.get("PYTHONPATH")))
+            ),
+        }
+        started = perf_counter()
+        result = subprocess.run(
+            command, env=environ, capture_output=True, text=True
+        )
+        total_ms = (perf_counter() - started) * 1000
+        if result.returncode:
+            raise CommandError(
+                f"Рабочий процесс завершился с ошибкой:\n{result.stderr}"
+            )
+        run = json.loads(result.stdout.splitlines()[-1])
+        run["total_ms"] = total_ms
+        return run, result.stderr
@@ -0,0 +1,120 @@
+import base64
+import hashlib
+from pathlib import Path
+from urllib.request import urlopen
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django_bootstrap5.core import css_url
+
+from core.css import CRITICAL_CSS, SITE_CSS, content_words, purge_css
+
+# Third-party code that renders Bootstrap markup for our templates.
+CONTENT_PACKAGES = ("django_bootstrap5",)
+CONTENT_SUFFIXES = (".html", ".py")
+# Everything visible before the first scroll of a page.
+CRITICAL_TEMPLATES = (
+    "base.html",
+    "includes/header.html",
+    "includes/post_card.html",
+    "includes/category_link.html",
+)
+
+
+def _read_files(directories):
+    for directory in directories:
+        for path in sorted(Path(directory).rglob("*")):
+            if path.suffix in CONTENT_SUFFIXES and path.is_file():
+                yield path.read_text(encoding="utf-8")
+
+
+def content_directories():
+    directories = list(settings.TEMPLATES[0]["DIRS"])
+    for app_config in apps.get_app_configs():
+        app_path = Path(app_config.path)
+        if (
+            app_path.is_relative_to(settings.BASE_DIR)
+            or app_config.name in CONTENT_PACKAGES
+        ):
+            directories.append(app_path)
+    return directories
+
+
+def verify_integrity(content, integrity):
+    algorithm, _, expected = integrity.partition("-")
+    digest = base64.b64encode(hashlib.new(algorithm, content).digest())
+    return digest.decode("ascii") == expected
+
+
+class Command(BaseCommand):
+    help = (
+        "Собирает стили сайта из локальной копии Bootstrap: удаляет правила"
+        " для классов, которых нет в шаблонах, и выделяет критические стили"
+        " первого экрана для встраивания в base.html."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            type=Path,
+            default=settings.BOOTSTRAP_SOURCE_CSS,
+            help="Локальная копия bootstrap.min.css.",
+        )
+        parser.add_argument(
+            "--download",
+            action="store_true",
+            help=(
+                "Скачать в --source версию Bootstrap, закреплённую"
+                " в django_bootstrap5, с проверкой целостности."
+            ),
+        )
+        parser.add_argument(
+            "--output-dir",
+            type=Path,
+            default=settings.STATICFILES_DIRS[0],
+        )
+
+    def handle(self, *args, **options):
+        source = options["source"]
+        if options["download"]:
+            self.download(source)
+        if not source.is_file():
+            raise CommandError(
+                f"Нет файла {source}; скачайте его с --download или"
+                " укажите путь в --source."
+            )
+        css = source.read_text(encoding="utf-8")
+        site_css = purge_css(
+            css, content_words(_read_files(content_directories()))
+        )
+        templates_dir = Path(settings.TEMPLATES[0]["DIRS"][0])
+        critical_css = purge_css(
+            site_css,
+            content_words(
+                (templates_dir / name).read_text(encoding="utf-8")
+                for name in CRITICAL_TEMPLATES
+            ),
+        )
+        for name, content in ((SITE_CSS, site_css),
+                              (CRITICAL_CSS, critical_css)):
+            path = options["output_dir"] / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            self.stdout.write(
+                f"{name}: {len(content) / 1024:.1f} КБ"
+                f" из {len(css) / 1024:.1f} КБ"
+            )
+
+    def download(self, source):
+        bootstrap = css_url()
+        with urlopen(bootstrap["url"], timeout=30) as response:
+            content = response.read()
+        if not verify_integrity(content, bootstrap["integrity"]):
+            raise CommandError(
+                f"Контрольная сумма {bootstrap['url']} не совпадает"
+                " с указанной в django_bootstrap5."
+            )
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_bytes(content)
+        self.stdout.write(f"Скачан {bootstrap['url']}")
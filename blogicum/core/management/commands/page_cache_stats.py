@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from core.cache import page_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Показывает число попаданий и промахов кеша страниц."
+
+    def handle(self, *args, **options):
+        stats = page_cache_stats()
+        total = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / total if total else 0
+        self.stdout.write(
+            f"Попадания: {stats['hits']}\n"
+            f"Промахи: {stats['misses']}\n"
+            f"Доля попаданий: {ratio:.1%}"
+        )
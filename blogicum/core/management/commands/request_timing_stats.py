@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.timing import histogram_quantile, request_timing_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Показывает число запросов и распределение времени ответа"
+        " по адресам за последние минуты."
+    )
+
+    def handle(self, *args, **options):
+        stats = request_timing_stats()
+        minutes = (
+            settings.REQUEST_TIMING_WINDOW
+            * settings.REQUEST_TIMING_WINDOWS / 60
+        )
+        self.stdout.write(f"За последние {minutes:g} мин.:")
+        for view_name, result in sorted(
+            stats.items(), key=lambda item: -item[1]["count"]
+        ):
+            p50, p95, p99 = (
+                histogram_quantile(result["buckets"], quantile)
+                for quantile in (0.5, 0.95, 0.99)
+            )
+            self.stdout.write(
+                f"{view_name}: запросов {result['count']},"
+                f" среднее {result['mean_ms']:.1f} мс,"
+                f" p50 ≤ {p50:g} мс, p95 ≤ {p95:g} мс, p99 ≤ {p99:g} мс"
+            )
@@ -0,0 +1,133 @@
+import random
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from faker import Faker
+from mixer.backend.django import Mixer
+
+from blog.models import Category, Comment, Location, Post, User
+
+USERNAME_PREFIX = "bench_"
+
+
+class Command(BaseCommand):
+    help = (
+        "Заполняет базу данных объёмом данных, близким к рабочему,"
+        " для замеров производительности."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=5000)
+        parser.add_argument("--posts", type=int, default=100000)
+        parser.add_argument("--comments", type=int, default=1000000)
+        parser.add_argument("--categories", type=int, default=50)
+        parser.add_argument("--locations", type=int, default=200)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        if User.objects.filter(
+            username__startswith=USERNAME_PREFIX
+        ).exists():
+            raise CommandError(
+                "Данные для замеров уже загружены в эту базу данных."
+            )
+        self.random = random.Random(options["seed"])
+        self.faker = Faker("ru_RU")
+        self.faker.seed_instance(options["seed"])
+        self.mixer = Mixer(commit=False)
+        self.batch_size = options["batch_size"]
+        with transaction.atomic():
+            users = self.create_users(options["users"])
+            categories = self.create_categories(options["categories"])
+            locations = self.create_locations(options["locations"])
+            post_ids = self.create_posts(
+                options["posts"], users, categories, locations
+            )
+            self.create_comments(options["comments"], users, post_ids)
+        call_command("recount_comments", stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(
+            f"Пользователей: {len(users)}, публикаций: {len(post_ids)},"
+            f" комментариев: {options['comments']}"
+        ))
+
+    def create_users(self, count):
+        # SQLite does not return primary keys from bulk inserts, so the
+        # created rows are read back.
+        User.objects.bulk_create(
+            self.mixer.cycle(count).blend(
+                User,
+                username=self.mixer.sequence(f"{USERNAME_PREFIX}{{0}}"),
+            ),
+            batch_size=self.batch_size,
+        )
+        return list(
+            User.objects.filter(username__startswith=USERNAME_PREFIX)
+        )
+
+    def create_categories(self, count):
+        categories = self.mixer.cycle(count).blend(
+            Category,
+            slug=self.mixer.sequence(f"{USERNAME_PREFIX}{{0}}"),
+            is_published=True,
+        )
+        for category in self.random.sample(categories, count // 10):
+            category.is_published = False
+        Category.objects.bulk_create(categories)
+        return list(
+            Category.objects.filter(slug__startswith=USERNAME_PREFIX)
+        )
+
+    def create_locations(self, count):
+        Location.objects.bulk_create(self.mixer.cycle(count).blend(Location))
+        return list(Location.objects.order_by("-pk")[:count])
+
+    def create_posts(self, count, users, categories, locations):
+        # Most posts are published in the past, a few are hidden or
+        # scheduled, the way a live feed looks.
+        now = timezone.now()
+        posts = []
+        for _ in range(count):
+            posts.append(Post(
+                title=self.faker.sentence(nb_words=6)[:256],
+                text=self.faker.paragraph(nb_sentences=8),
+                pub_date=now - timedelta(
+                    minutes=self.random.randint(-60 * 24 * 7, 60 * 24 * 365)
+                ),
+                is_published=self.random.random() > 0.05,
+                author=self.random.choice(users),
+                category=self.random.choice(categories),
+                location=(
+                    self.random.choice(locations)
+                    if self.random.random() > 0.3 else None
+                ),
+            ))
+            if len(posts) == self.batch_size:
+                Post.objects.bulk_create(posts)
+                posts = []
+        Post.objects.bulk_create(posts)
+        return list(
+            Post.objects.filter(
+                author__username__startswith=USERNAME_PREFIX
+            ).values_list("pk", flat=True)
+        )
+
+    def create_comments(self, count, users, post_ids):
+        # Comments are skewed towards a small share of popular posts.
+        popular = post_ids[:max(1, len(post_ids) // 20)]
+        sentences = [self.faker.sentence(nb_words=12) for _ in range(1000)]
+        comments = []
+        for _ in range(count):
+            pool = popular if self.random.random() < 0.5 else post_ids
+            comments.append(Comment(
+                text=self.random.choice(sentences),
+                post_id=self.random.choice(pool),
+                author=self.random.choice(users),
+            ))
+            if len(comments) == self.batch_size:
+                Comment.objects.bulk_create(comments)
+                comments = []
+        Comment.objects.bulk_create(comments)
@@ -0,0 +1,49 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.outbox import deliver_batch
+
+
+class Command(BaseCommand):
+    help = "Отправляет письма из очереди исходящих писем."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.OUTBOX_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Не завершаться, а ждать новые письма.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Пауза между проверками очереди в режиме --loop, с.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            try:
+                sent, failed = deliver_batch(options["batch_size"])
+            except Exception as error:
+                if not options["loop"]:
+                    raise
+                # A worker in --loop mode outlives a broken database or
+                # mail server and tries again after the pause.
+                self.stderr.write(f"Ошибка отправки: {error}")
+                time.sleep(options["interval"])
+                continue
+            if sent or failed:
+                self.stdout.write(
+                    f"Отправлено: {sent}, ошибок: {failed}"
+                )
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,199 @@
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from collections import defaultdict
+from math import inf
+from time import monotonic
+
+from django.conf import settings
+
+METRIC_PREFIX = "blogicum"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, inf)
+METRICS = {
+    "http_requests_total": (
+        "counter", "Обработанные запросы по адресам и кодам ответа."
+    ),
+    "http_request_duration_seconds": (
+        "histogram", "Время ответа по адресам."
+    ),
+    "db_queries_total": ("counter", "SQL-запросы по адресам."),
+    "db_query_duration_seconds_total": (
+        "counter", "Суммарное время SQL-запросов по адресам."
+    ),
+    "page_cache_requests_total": (
+        "counter", "Обращения к кешу страниц: попадания и промахи."
+    ),
+    "outbox_emails": ("gauge", "Письма в очереди отправки по статусам."),
+    "image_backlog_posts": (
+        "gauge", "Публикации с необработанными изображениями."
+    ),
+}
+
+_pending = defaultdict(float)
+_lock = threading.Lock()
+_last_flush = monotonic()
+_connection = None
+
+
+def _series(name, labels):
+    return name, json.dumps(labels, sort_keys=True, ensure_ascii=False)
+
+
+def inc(name, value=1, **labels):
+    with _lock:
+        _pending[_series(name, labels)] += value
+
+
+def observe(name, value, buckets=LATENCY_BUCKETS, **labels):
+    # Buckets are stored as plain counts and made cumulative when the
+    # metrics are rendered.
+    bound = next(bound for bound in buckets if value <= bound)
+    with _lock:
+        _pending[_series(f"{name}_bucket", {**labels, "le": bound})] += 1
+        _pending[_series(f"{name}_sum", labels)] += value
+        _pending[_series(f"{name}_count", labels)] += 1
+
+
+def _get_connection():
+    # Every worker process keeps its own connection to the shared file;
+    # a connection inherited through fork is never reused.
+    global _connection
+    path = str(settings.METRICS_DB_PATH)
+    if _connection is None or _connection[:2] != (os.getpid(), path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        raw_connection = sqlite3.connect(path, timeout=5)
+        raw_connection.execute("PRAGMA journal_mode = WAL")
+        raw_connection.execute("PRAGMA synchronous = NORMAL")
+        raw_connection.execute(
+            "CREATE TABLE IF NOT EXISTS metrics ("
+            " name TEXT NOT NULL, labels TEXT NOT NULL,"
+            " value REAL NOT NULL, PRIMARY KEY (name, labels)"
+            ") WITHOUT ROWID"
+        )
+        _connection = (os.getpid(), path, raw_connection)
+    return _connection[2]
+
+
+def flush():
+    global _last_flush
+    with _lock:
+        increments = list(_pending.items())
+        _pending.clear()
+        _last_flush = monotonic()
+    if not increments:
+        return
+    raw_connection = _get_connection()
+    with raw_connection:
+        raw_connection.executemany(
+            "INSERT INTO metrics (name, labels, value) VALUES (?, ?, ?)"
+            " ON CONFLICT (name, labels)"
+            " DO UPDATE SET value = value + excluded.value",
+            [(name, labels, value) for (name, labels), value in increments],
+        )
+
+
+def maybe_flush():
+    # Counters are summed in memory and written to the shared store at
+    # most once per METRICS_FLUSH_INTERVAL, so a request costs no disk
+    # write.
+    if monotonic() - _last_flush >= settings.METRICS_FLUSH_INTERVAL:
+        flush()
+
+
+def _forget_parent_state():
+    # A forked worker starts with a copy of the parent's unsent counters;
+    # they belong to the parent, which flushes them itself.
+    global _lock
+    _lock = threading.Lock()
+    _pending.clear()
+
+
+atexit.register(flush)
+os.register_at_fork(after_in_child=_forget_parent_state)
+
+
+def prune(names, label, before):
+    # Drops the series of the given names whose numeric label is below
+    # before, for series keyed by a time window.
+    placeholders = ", ".join("?" * len(names))
+    raw_connection = _get_connection()
+    with raw_connection:
+        raw_connection.execute(
+            f"DELETE FROM metrics WHERE name IN ({placeholders})"
+            " AND json_extract(labels, ?) < ?",
+            [*names, f"$.{label}", before],
+        )
+
+
+def read_metrics():
+    flush()
+    rows = _get_connection().execute(
+        "SELECT name, labels, value FROM metrics ORDER BY name, labels"
+    )
+    return [(name, json.loads(labels), value) for name, labels, value in rows]
+
+
+def _format_value(value):
+    if value == inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            key,
+            _format_value(value).replace("\\", "\\\\")
+            .replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for key, value in sorted(labels.items())
+    )
+    return f"{{{pairs}}}"
+
+
+def _histogram_samples(family, rows):
+    buckets = defaultdict(dict)
+    for name, labels, value in rows:
+        if name == f"{family}_bucket":
+            bound = labels.pop("le")
+            buckets[json.dumps(labels, sort_keys=True)][bound] = value
+    for labels, counts in sorted(buckets.items()):
+        seen = 0
+        for bound in LATENCY_BUCKETS:
+            seen += counts.get(bound, 0)
+            yield f"{family}_bucket", {**json.loads(labels), "le": bound}, seen
+    for name, labels, value in rows:
+        if name in (f"{family}_sum", f"{family}_count"):
+            yield name, labels, value
+
+
+def render_metrics(rows, gauges):
+    # Prometheus text exposition format 0.0.4. Gauges are measured at
+    # scrape time and passed in as {family: [(labels, value), ...]}.
+    lines = []
+    for family, (kind, description) in METRICS.items():
+        if kind == "histogram":
+            samples = list(_histogram_samples(family, rows))
+        elif kind == "gauge":
+            samples = [
+                (family, labels, value)
+                for labels, value in gauges.get(family, ())
+            ]
+        else:
+            samples = [row for row in rows if row[0] == family]
+        if not samples:
+            continue
+        lines.append(f"# HELP {METRIC_PREFIX}_{family} {description}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_{family} {kind}")
+        lines.extend(
+            f"{METRIC_PREFIX}_{name}{_format_labels(labels)}"
+            f" {_format_value(value)}"
+            for name, labels, value in samples
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,118 @@
+import logging
+from contextlib import ExitStack
+from time import perf_counter
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.db import connections
+from django.utils.functional import SimpleLazyObject
+
+from . import metrics
+from .auth import get_cached_user
+from .staticfiles import (
+    IMMUTABLE_CACHE_CONTROL,
+    hashed_names,
+    scan_static_root,
+    serve_static,
+)
+from .timing import UNMATCHED_VIEW, RequestTiming, record_request_timing
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTimingMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timing = request._timing = RequestTiming(
+            settings.SLOW_REQUEST_TOP_QUERIES
+        )
+        started = perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timing))
+            response = self.get_response(request)
+        total = perf_counter() - started
+        if hasattr(request, "_view_started"):
+            timing.view = max(
+                total - (request._view_started - started) - timing.template,
+                0,
+            )
+        response["Server-Timing"] = timing.server_timing(total)
+        view_name = (
+            request.resolver_match.view_name
+            if request.resolver_match else UNMATCHED_VIEW
+        )
+        record_request_timing(view_name, total * 1000)
+        self.record_metrics(request, response, view_name, total, timing)
+        if total * 1000 >= settings.SLOW_REQUEST_MS:
+            self.log_slow_request(request, response, view_name, total, timing)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._view_started = perf_counter()
+
+    def record_metrics(self, request, response, view_name, total, timing):
+        metrics.inc(
+            "http_requests_total",
+            view=view_name,
+            method=request.method,
+            status=response.status_code,
+        )
+        metrics.observe(
+            "http_request_duration_seconds", total, view=view_name
+        )
+        metrics.inc("db_queries_total", timing.queries, view=view_name)
+        metrics.inc(
+            "db_query_duration_seconds_total", timing.db, view=view_name
+        )
+        metrics.maybe_flush()
+
+    def log_slow_request(self, request, response, view_name, total, timing):
+        queries = "\n".join(
+            f"  {duration * 1000:.1f} мс: {sql[:500]}"
+            for duration, sql in timing.slowest_queries()
+        )
+        logger.warning(
+            "Медленный запрос %s %s (%s, %s): %.1f мс, SQL-запросов %s"
+            " за %.1f мс, шаблоны %.1f мс\n%s",
+            request.method, request.get_full_path(), view_name,
+            response.status_code, total * 1000, timing.queries,
+            timing.db * 1000, timing.template * 1000, queries,
+        )
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_cached_user(request))
+
+
+class StaticFilesMiddleware:
+    # Serves the output of collectstatic, so no separate static server
+    # is needed: precompressed variants by Accept-Encoding, and hashed
+    # names cached by browsers for a year.
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = urlparse(settings.STATIC_URL).path
+        root = settings.STATIC_ROOT
+        self.files = scan_static_root(root) if root else {}
+        self.hashed = hashed_names(root) if root else set()
+
+    def __call__(self, request):
+        path = request.path_info
+        if request.method in ("GET", "HEAD") and path.startswith(self.prefix):
+            name = path[len(self.prefix):]
+            paths = self.files.get(name)
+            if paths is not None:
+                return serve_static(
+                    request, name, paths,
+                    IMMUTABLE_CACHE_CONTROL if name in self.hashed
+                    else f"public, max-age={settings.STATIC_CACHE_MAX_AGE}",
+                )
+        return self.get_response(request)
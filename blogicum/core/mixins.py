@@ -1,21 +1,108 @@
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.cache import cache
 from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    quote_etag,
+)
+from django.utils.http import http_date
 from django.views import View
 
 from blog.models import Comment
-from core.utils import get_post_data
+from core.cache import (
+    count_page_cache,
+    get_page_key,
+    get_page_validators,
+    is_page_cacheable,
+)
+from core.utils import get_post_data, get_request_object
 
 
-class CommentMixinView(LoginRequiredMixin, View):
+class AnonymousPageCacheMixin:
+
+    def get_page_cache_groups(self):
+        raise NotImplementedError(
+            "Override `get_page_cache_groups` in the view class"
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        groups = is_page_cacheable(request) and self.get_page_cache_groups()
+        if not groups:
+            return super().dispatch(request, *args, **kwargs)
+        key = get_page_key(request, groups)
+        response = cache.get(key)
+        if response is not None:
+            count_page_cache("hits")
+            return response
+        count_page_cache("misses")
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code == 200 and not response.cookies:
+            def store(response):
+                cache.set(key, response, settings.PAGE_CACHE_TIMEOUT)
+
+            if getattr(response, "is_rendered", True):
+                store(response)
+            else:
+                response.add_post_render_callback(store)
+        return response
+
+
+class ConditionalGetMixin:
+    # Answers revalidations with 304 Not Modified. Validators are built
+    # from the same groups as the page cache and from the modification
+    # times of the shown posts, before the view renders anything.
+
+    def get_page_modified(self):
+        raise NotImplementedError(
+            "Override `get_page_modified` in the view class"
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        groups = (
+            request.method in ("GET", "HEAD")
+            and self.get_page_cache_groups()
+        )
+        if not groups:
+            return super().dispatch(request, *args, **kwargs)
+        etag, last_modified = get_page_validators(
+            request, groups, self.get_page_modified
+        )
+        etag = quote_etag(etag)
+        self.last_modified = last_modified
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        ) or super().dispatch(request, *args, **kwargs)
+        if response.status_code not in (200, 304):
+            return response
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(
+            response, no_cache=True, private=request.user.is_authenticated
+        )
+        return response
+
+
+class RequestObjectMixin:
+
+    def get_object(self, queryset=None):
+        if queryset is None:
+            queryset = self.get_queryset()
+        pk = self.kwargs[self.pk_url_kwarg]
+        return get_request_object(self.request, queryset, pk=pk)
+
+
+class CommentMixinView(LoginRequiredMixin, RequestObjectMixin, View):
     model = Comment
     template_name = "blog/comment.html"
     pk_url_kwarg = "comment_pk"
 
     def dispatch(self, request, *args, **kwargs):
-        if self.get_object().author != request.user:
+        if self.get_object().author_id != request.user.id:
             return redirect("blog:post_detail", pk=self.kwargs["pk"])
-        get_post_data(self.kwargs)
+        get_post_data(request, self.kwargs)
         return super().dispatch(request, *args, **kwargs)
 
     def get_success_url(self):
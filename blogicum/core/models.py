@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 
 class BaseModel(models.Model):
@@ -25,3 +26,67 @@ class BaseTitle(models.Model):
 
     class Meta:
         abstract = True
+
+
+class EmailOutbox(models.Model):
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Ожидает отправки"
+        SENT = "sent", "Отправлено"
+        FAILED = "failed", "Не удалось отправить"
+
+    subject = models.CharField(
+        max_length=256,
+        verbose_name="Тема",
+    )
+    message = models.TextField(
+        verbose_name="Текст письма",
+    )
+    from_email = models.EmailField(
+        verbose_name="Отправитель",
+    )
+    recipient = models.EmailField(
+        verbose_name="Получатель",
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="Статус",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Попыток отправки",
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Следующая попытка",
+    )
+    last_error = models.TextField(
+        blank=True,
+        verbose_name="Последняя ошибка",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Добавлено",
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Отправлено",
+    )
+
+    class Meta:
+        verbose_name = "письмо"
+        verbose_name_plural = "Исходящие письма"
+        ordering = ("next_attempt_at",)
+        indexes = (
+            models.Index(
+                fields=("next_attempt_at",),
+                condition=models.Q(status="pending"),
+                name="outbox_pending_idx",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.subject} → {self.recipient}"
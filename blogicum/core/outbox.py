@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from core.models import EmailOutbox
+
+
+def enqueue_email(subject, message, from_email, recipient):
+    return EmailOutbox.objects.create(
+        subject=subject,
+        message=message,
+        from_email=from_email,
+        recipient=recipient,
+    )
+
+
+def claim_batch(batch_size):
+    # A message is claimed by moving its next attempt past the lease with
+    # a compare-and-set update, so concurrent workers never send it twice.
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=settings.OUTBOX_LEASE)
+    due = EmailOutbox.objects.filter(
+        status=EmailOutbox.Status.PENDING,
+        next_attempt_at__lte=now,
+    )[:batch_size]
+    claimed = []
+    for email in due:
+        updated = EmailOutbox.objects.filter(
+            pk=email.pk,
+            status=EmailOutbox.Status.PENDING,
+            next_attempt_at=email.next_attempt_at,
+        ).update(next_attempt_at=lease_until)
+        if updated:
+            claimed.append(email)
+    return claimed
+
+
+def retry_delay(attempts):
+    delay = settings.OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, settings.OUTBOX_MAX_RETRY_DELAY))
+
+
+def record_failure(email, error):
+    email.attempts += 1
+    email.last_error = f"{type(error).__name__}: {error}"
+    if email.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+        email.status = EmailOutbox.Status.FAILED
+    else:
+        email.next_attempt_at = timezone.now() + retry_delay(email.attempts)
+    email.save(update_fields=(
+        "attempts", "last_error", "status", "next_attempt_at"
+    ))
+
+
+def deliver(email, connection):
+    try:
+        EmailMessage(
+            subject=email.subject,
+            body=email.message,
+            from_email=email.from_email,
+            to=[email.recipient],
+            connection=connection,
+        ).send()
+    except Exception as error:
+        record_failure(email, error)
+        return False
+    email.attempts += 1
+    email.status = EmailOutbox.Status.SENT
+    email.sent_at = timezone.now()
+    email.save(update_fields=("attempts", "status", "sent_at"))
+    return True
+
+
+def deliver_batch(batch_size):
+    batch = claim_batch(batch_size)
+    if not batch:
+        return 0, 0
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as error:
+        # The server is unreachable: every claimed message counts a failed
+        # attempt instead of waiting for the lease to run out.
+        for email in batch:
+            record_failure(email, error)
+        return 0, len(batch)
+    sent = 0
+    try:
+        for email in batch:
+            sent += deliver(email, connection)
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+    return sent, len(batch) - sent
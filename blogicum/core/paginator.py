@@ -0,0 +1,197 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Sequence
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage, InvalidPage, Paginator
+from django.db.models import Max, Q
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+class CursorPage(Sequence):
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return f"<CursorPage of {len(self)} objects>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        if self.has_next():
+            return self.paginator.encode_cursor(self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        if self.has_previous():
+            return self.paginator.encode_cursor(self.object_list[0])
+
+
+class CursorPaginator:
+
+    def __init__(self, object_list, per_page, ordering):
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.fields = [name.lstrip("-") for name in self.ordering]
+        self.object_list = object_list.order_by(*self.ordering)
+
+    def encode_cursor(self, obj):
+        opts = self.object_list.model._meta
+        values = [
+            opts.get_field(name).value_to_string(obj) for name in self.fields
+        ]
+        token = urlsafe_b64encode(json.dumps(values).encode())
+        return token.decode().rstrip("=")
+
+    def decode_cursor(self, token):
+        opts = self.object_list.model._meta
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            values = json.loads(urlsafe_b64decode(padded.encode()))
+            if len(values) != len(self.fields):
+                raise ValueError
+            return [
+                opts.get_field(name).to_python(value)
+                for name, value in zip(self.fields, values)
+            ]
+        except (ValueError, TypeError, ValidationError):
+            raise InvalidCursor("Некорректный курсор страницы")
+
+    def _seek(self, values, forward):
+        condition = Q()
+        for i, name in enumerate(self.ordering):
+            descending = name.startswith("-")
+            lookup = "lt" if descending == forward else "gt"
+            step = Q(**{f"{self.fields[i]}__{lookup}": values[i]})
+            for field, value in zip(self.fields[:i], values[:i]):
+                step &= Q(**{field: value})
+            condition |= step
+        # An inclusive bound on the leading column keeps the lookup a
+        # single index range scan instead of an OR of scans.
+        descending = self.ordering[0].startswith("-")
+        bound = "lte" if descending == forward else "gte"
+        return Q(**{f"{self.fields[0]}__{bound}": values[0]}) & condition
+
+    def _reversed_ordering(self):
+        return [
+            name[1:] if name.startswith("-") else f"-{name}"
+            for name in self.ordering
+        ]
+
+    def _fetch(self, queryset):
+        rows = list(queryset[:self.per_page + 1])
+        return rows[:self.per_page], len(rows) > self.per_page
+
+    def _fetch_backwards(self, queryset):
+        rows, has_more = self._fetch(
+            queryset.order_by(*self._reversed_ordering())
+        )
+        rows.reverse()
+        return rows, has_more
+
+    def page(self, after=None, before=None, number=None, containing=None):
+        if containing is not None:
+            return self._page_containing(containing)
+        if after:
+            values = self.decode_cursor(after)
+            rows, has_next = self._fetch(
+                self.object_list.filter(self._seek(values, forward=True))
+            )
+            return CursorPage(rows, self, has_next, True)
+        if before:
+            values = self.decode_cursor(before)
+            rows, has_previous = self._fetch_backwards(
+                self.object_list.filter(self._seek(values, forward=False))
+            )
+            return CursorPage(rows, self, True, has_previous)
+        if number == "last":
+            rows, has_previous = self._fetch_backwards(self.object_list)
+            return CursorPage(rows, self, False, has_previous)
+        return self._legacy_page(number or 1)
+
+    def _page_containing(self, obj):
+        # Pages are aligned to multiples of per_page from the start, the
+        # same pages the chain of next cursors walks through.
+        values = [getattr(obj, name) for name in self.fields]
+        position = self.object_list.filter(
+            self._seek(values, forward=False)
+        ).count()
+        offset = position - position % self.per_page
+        rows, has_next = self._fetch(self.object_list[offset:])
+        return CursorPage(rows, self, has_next, offset > 0)
+
+    def _legacy_page(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise InvalidPage("Номер страницы должен быть целым числом")
+        if number < 1:
+            raise InvalidPage("Номер страницы меньше 1")
+        offset = (number - 1) * self.per_page
+        rows, has_next = self._fetch(self.object_list[offset:])
+        if not rows and number > 1:
+            raise InvalidPage("Страница не содержит результатов")
+        return CursorPage(rows, self, has_next, number > 1)
+
+
+class ApproximateCountPaginator(Paginator):
+    # Rows are counted exactly only up to count_limit. Past it, a whole
+    # table is sized by its largest primary key and a filtered queryset
+    # is reported as count_limit, so counting never scans the table.
+    # Pages after a capped count are found by probing for their rows.
+    count_limit = 10000
+    count_is_capped = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        count = queryset.order_by().values("pk")[:self.count_limit + 1].count()
+        if count <= self.count_limit:
+            return count
+        if not queryset.query.where:
+            return queryset.model._default_manager.aggregate(
+                last_pk=Max("pk")
+            )["last_pk"]
+        self.count_is_capped = True
+        return self.count_limit
+
+    def validate_number(self, number):
+        try:
+            number = super().validate_number(number)
+        except EmptyPage:
+            if not self.count_is_capped or int(number) < 1:
+                raise
+            number = int(number)
+        if self.count_is_capped and number >= self.num_pages:
+            # One row past the page tells whether a next page exists.
+            bottom = (number - 1) * self.per_page
+            rows = self.object_list.order_by().values("pk")[
+                bottom:bottom + self.per_page + 1
+            ].count()
+            if not rows:
+                raise EmptyPage("Страница не содержит результатов")
+            self.count = max(self.count, bottom + rows)
+            vars(self).pop("num_pages", None)
+        return number
@@ -0,0 +1,95 @@
+import re
+
+from django.db import connections
+
+from blog.models import Post
+
+FTS_TABLE = "blog_post_fts"
+MAX_TERMS = 8
+MIN_STEM_LENGTH = 3
+# Inflectional endings of Russian nouns, adjectives and verbs, longest
+# first; a word stripped of its ending is searched as a prefix, so the
+# other forms of the same word match too.
+RUSSIAN_ENDINGS = (
+    "иями", "ями", "ами", "ого", "его", "ому", "ему", "ыми", "ими", "ией",
+    "ать", "ять", "ить", "еть", "ешь", "ете", "ишь", "ите", "ут", "ют",
+    "ах", "ях", "ам", "ям", "ов", "ев", "ей", "ой", "ий", "ый", "ая", "яя",
+    "ое", "ее", "ые", "ие", "ом", "ем", "ую", "юю", "ия", "ью",
+    "а", "я", "о", "е", "ы", "и", "у", "ю", "ь", "й",
+)
+
+TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert
+    AFTER INSERT ON blog_post BEGIN
+        INSERT INTO {FTS_TABLE} (rowid, title, text)
+        VALUES (new.id, new.title, new.text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete
+    AFTER DELETE ON blog_post BEGIN
+        INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, title, text)
+        VALUES ('delete', old.id, old.title, old.text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update
+    AFTER UPDATE OF title, text ON blog_post BEGIN
+        INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, title, text)
+        VALUES ('delete', old.id, old.title, old.text);
+        INSERT INTO {FTS_TABLE} (rowid, title, text)
+        VALUES (new.id, new.title, new.text);
+    END
+    """,
+)
+
+
+def stem(word):
+    for ending in RUSSIAN_ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= (
+            MIN_STEM_LENGTH
+        ):
+            return word[:-len(ending)]
+    return word
+
+
+def search_match(query):
+    words = re.findall(r"\w+", query.lower())[:MAX_TERMS]
+    return " ".join(f'"{stem(word)}"*' for word in words)
+
+
+def search_posts(queryset, query):
+    match = search_match(query)
+    if not match:
+        return queryset.none()
+    # The index is joined directly, so the published predicate and the
+    # ranking are resolved in a single query.
+    return queryset.extra(
+        tables=[FTS_TABLE],
+        where=[
+            f"{FTS_TABLE}.rowid = {Post._meta.db_table}.id",
+            f"{FTS_TABLE} MATCH %s",
+        ],
+        params=[match],
+        select={"search_rank": f"bm25({FTS_TABLE}, 5.0, 1.0)"},
+        order_by=["search_rank", "-pub_date"],
+    )
+
+
+def ensure_search_triggers(using):
+    # Rebuilding blog_post during a migration drops its triggers, so they
+    # are recreated after every migrate.
+    connection = connections[using]
+    if FTS_TABLE not in connection.introspection.table_names():
+        return
+    with connection.cursor() as cursor:
+        for trigger in TRIGGERS:
+            cursor.execute(trigger)
+
+
+def rebuild_search_index(using):
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('rebuild')"
+        )
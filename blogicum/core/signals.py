@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .auth import forget_user
+from .db import apply_sqlite_pragmas, sqlite_connection_is_alive
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs):
+    if connection.vendor == "sqlite":
+        apply_sqlite_pragmas(connection.connection, settings.SQLITE_PRAGMAS)
+
+
+@receiver(request_started)
+def check_persistent_connections(**kwargs):
+    # A persistent connection is reused by the next request only after
+    # it answers a trivial query; a broken one is closed and reopened.
+    for connection in connections.all():
+        if (
+            connection.vendor == "sqlite"
+            and connection.connection is not None
+            and connection.settings_dict.get("CONN_HEALTH_CHECKS")
+            and not connection.in_atomic_block
+            and not sqlite_connection_is_alive(connection.connection)
+        ):
+            connection.close()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def forget_cached_user(sender, instance, **kwargs):
+    # Covers profile edits, password changes and deactivation; other
+    # workers see the new version token in the shared cache.
+    forget_user(instance.pk)
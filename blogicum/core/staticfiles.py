@@ -0,0 +1,127 @@
+import gzip
+import json
+import mimetypes
+from pathlib import Path
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Preferred first; brotli variants exist only with the brotli package.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+COMPRESSIBLE_EXTENSIONS = (
+    ".css", ".js", ".map", ".json", ".svg", ".ico", ".txt", ".xml",
+    ".ttf", ".otf", ".eot",
+)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def compress(content):
+    variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(content, quality=11)
+    return {
+        suffix: compressed for suffix, compressed in variants.items()
+        if len(compressed) < len(content)
+    }
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        # Both the original and the hashed copy get compressed siblings:
+        # templates refer to the hashed names, CSS of third-party apps
+        # may still point at the originals.
+        names = set(self.hashed_files) | set(self.hashed_files.values())
+        for name in sorted(names):
+            if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            with self.open(name) as original:
+                content = original.read()
+            for suffix, compressed in compress(content).items():
+                if self.exists(name + suffix):
+                    self.delete(name + suffix)
+                self._save(name + suffix, ContentFile(compressed))
+
+
+def scan_static_root(root):
+    # {name: {encoding or None: path}} for every collected file; the
+    # directory is read once, when a worker loads its middleware.
+    root = Path(root)
+    files = {}
+    if not root.is_dir():
+        return files
+    for path in root.rglob("*"):
+        if not path.is_file():
+            continue
+        name = path.relative_to(root).as_posix()
+        for encoding, suffix in ENCODINGS:
+            if name.endswith(suffix):
+                files.setdefault(name[:-len(suffix)], {})[encoding] = path
+                break
+        else:
+            files.setdefault(name, {})[None] = path
+    return {name: paths for name, paths in files.items() if None in paths}
+
+
+def hashed_names(root):
+    manifest = Path(root) / ManifestStaticFilesStorage.manifest_name
+    if not manifest.is_file():
+        return set()
+    return set(json.loads(manifest.read_text())["paths"].values())
+
+
+def accepted_encodings(header):
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        quality = params.strip().replace(" ", "")
+        try:
+            if quality.startswith("q=") and float(quality[2:]) == 0:
+                continue
+        except ValueError:
+            continue
+        if coding.strip():
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def serve_static(request, name, paths, cache_control):
+    accepted = accepted_encodings(
+        request.META.get("HTTP_ACCEPT_ENCODING", "")
+    )
+    encoding = next(
+        (encoding for encoding, _ in ENCODINGS
+         if encoding in paths and encoding in accepted),
+        None,
+    )
+    path = paths[encoding]
+    stat = path.stat()
+    if not was_modified_since(
+        request.META.get("HTTP_IF_MODIFIED_SINCE"), stat.st_mtime
+    ):
+        response = HttpResponseNotModified()
+    else:
+        content_type, _ = mimetypes.guess_type(name)
+        response = FileResponse(
+            path.open("rb"),
+            content_type=content_type or "application/octet-stream",
+        )
+        response["Last-Modified"] = http_date(stat.st_mtime)
+        if encoding is not None:
+            response["Content-Encoding"] = encoding
+    response["Cache-Control"] = cache_control
+    if len(paths) > 1:
+        patch_vary_headers(response, ("Accept-Encoding",))
+    return response
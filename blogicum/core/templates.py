@@ -0,0 +1,56 @@
+from pathlib import Path
+from time import perf_counter
+
+from django.template import TemplateDoesNotExist, engines
+from django.template.backends.django import DjangoTemplates, Template, reraise
+
+
+class TimedTemplate(Template):
+
+    def render(self, context=None, request=None):
+        timing = getattr(request, "_timing", None)
+        if timing is None or timing.rendering:
+            return super().render(context, request)
+        timing.rendering = True
+        started = perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            timing.template += perf_counter() - started
+            timing.rendering = False
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    # Adds the render time of every top-level template to the timing of
+    # the request it is rendered for.
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+# Admin templates load the admin template tags, and with them the admin
+# itself; they are compiled on the first admin request instead.
+PRECOMPILE_SKIP_DIRS = ("admin",)
+
+
+def precompile_templates():
+    # Fills the cached loader with every template of the project
+    # directories, so the first requests of a worker do not parse them.
+    compiled = 0
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        for directory in engine.engine.dirs:
+            for path in sorted(Path(directory).rglob("*.html")):
+                name = path.relative_to(directory)
+                if name.parts[0] in PRECOMPILE_SKIP_DIRS:
+                    continue
+                engine.get_template(name.as_posix())
+                compiled += 1
+    return compiled
@@ -0,0 +1,41 @@
+import os
+from functools import lru_cache
+
+from django import template
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from django_bootstrap5.templatetags.django_bootstrap5 import bootstrap_css
+
+from core.css import CRITICAL_CSS, SITE_CSS
+
+register = template.Library()
+
+
+@lru_cache(maxsize=8)
+def _read_css(path, modified):
+    with open(path, encoding="utf-8") as css:
+        return css.read()
+
+
+@register.simple_tag
+def site_css():
+    # The critical part is inlined for the first paint; the whole
+    # stylesheet is fetched without blocking rendering.
+    critical_path = finders.find(CRITICAL_CSS)
+    if critical_path is None or finders.find(SITE_CSS) is None:
+        # build_css has not been run: pages still render with the CDN
+        # stylesheet, and check --deploy reports the missing build.
+        return bootstrap_css()
+    critical = _read_css(critical_path, os.stat(critical_path).st_mtime_ns)
+    href = static(SITE_CSS)
+    return format_html(
+        "<style>{}</style>"
+        '<link rel="preload" href="{}" as="style"'
+        " onload=\"this.onload=null;this.rel='stylesheet'\">"
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        mark_safe(critical),
+        href,
+        href,
+    )
@@ -0,0 +1,138 @@
+import heapq
+from math import inf
+from time import perf_counter, time
+
+from django.conf import settings
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from core import metrics
+
+# Kept out of METRICS, so the windowed series are not exported.
+TIMING_METRIC = "request_timing_ms"
+TIMING_SERIES = ("bucket", "sum", "count")
+TIMING_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, inf)
+UNMATCHED_VIEW = "unmatched"
+
+_pruned_window = None
+
+
+class RequestTiming:
+    # Collects the cost of one request; it is installed as a database
+    # execute wrapper, so every query passes through __call__.
+
+    def __init__(self, top_size):
+        self.queries = 0
+        self.db = 0.0
+        self.template = 0.0
+        self.view = 0.0
+        self.rendering = False
+        self.top_size = top_size
+        self.top_queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = perf_counter() - started
+            self.queries += 1
+            self.db += duration
+            # Only a reference to the SQL text is kept, and only for the
+            # slowest queries; parameters are never formatted.
+            entry = (duration, self.queries, sql)
+            if len(self.top_queries) < self.top_size:
+                heapq.heappush(self.top_queries, entry)
+            elif duration > self.top_queries[0][0]:
+                heapq.heapreplace(self.top_queries, entry)
+
+    def slowest_queries(self):
+        return [
+            (duration, sql)
+            for duration, _, sql in sorted(self.top_queries, reverse=True)
+        ]
+
+    def server_timing(self, total):
+        return ", ".join((
+            f'db;dur={self.db * 1000:.1f};desc="SQL: {self.queries}"',
+            f"tpl;dur={self.template * 1000:.1f}",
+            f"view;dur={self.view * 1000:.1f}",
+            f"total;dur={total * 1000:.1f}",
+        ))
+
+
+def _window(now=None):
+    return int((now or time()) // settings.REQUEST_TIMING_WINDOW)
+
+
+def record_request_timing(view_name, duration_ms):
+    # Histograms are kept per time window in the shared metrics store, so
+    # the numbers of every worker add up; windows older than the last few
+    # minutes are dropped when a new one starts.
+    global _pruned_window
+    window = _window()
+    metrics.observe(
+        TIMING_METRIC, duration_ms, buckets=TIMING_BUCKETS_MS,
+        view=view_name, window=window,
+    )
+    if window != _pruned_window:
+        _pruned_window = window
+        metrics.prune(
+            [f"{TIMING_METRIC}_{suffix}" for suffix in TIMING_SERIES],
+            "window",
+            window - settings.REQUEST_TIMING_WINDOWS + 1,
+        )
+
+
+def iter_view_names(patterns, namespace=None):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            inner = namespace
+            if pattern.namespace:
+                inner = ":".join(filter(None, (namespace, pattern.namespace)))
+            yield from iter_view_names(pattern.url_patterns, inner)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield ":".join(filter(None, (namespace, pattern.name)))
+
+
+def request_timing_stats(view_names=None):
+    if view_names is None:
+        view_names = sorted(
+            set(iter_view_names(get_resolver().url_patterns))
+        ) + [UNMATCHED_VIEW]
+    current = _window()
+    windows = range(current - settings.REQUEST_TIMING_WINDOWS + 1, current + 1)
+    buckets = {
+        view_name: dict.fromkeys(TIMING_BUCKETS_MS, 0)
+        for view_name in view_names
+    }
+    totals = dict.fromkeys(view_names, 0)
+    for name, labels, value in metrics.read_metrics():
+        view_name = labels.get("view")
+        if view_name not in totals or labels.get("window") not in windows:
+            continue
+        if name == f"{TIMING_METRIC}_bucket":
+            buckets[view_name][labels["le"]] += int(value)
+        elif name == f"{TIMING_METRIC}_sum":
+            totals[view_name] += value
+    stats = {}
+    for view_name in view_names:
+        count = sum(buckets[view_name].values())
+        if count:
+            stats[view_name] = {
+                "count": count,
+                "mean_ms": totals[view_name] / count,
+                "buckets": buckets[view_name],
+            }
+    return stats
+
+
+def histogram_quantile(buckets, quantile):
+    # The upper bound of the bucket holding the quantile, the way
+    # Prometheus reads a histogram without interpolation.
+    rank = quantile * sum(buckets.values())
+    seen = 0
+    for bound, count in buckets.items():
+        seen += count
+        if seen >= rank:
+            return bound
+    return inf
@@ -1,9 +1,16 @@
-from django.db.models import Count
+from datetime import datetime
+
+from django.conf import settings
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 
 from blog.models import Post
 from django.utils import timezone
 
+POST_ORDERING = ("-pub_date", "-id")
+COMMENT_ORDERING = ("created_at", "id")
+
 
 def post_all_query():
     query_set = (
@@ -12,27 +19,67 @@ def post_all_query():
             "location",
             "author",
         )
-        .annotate(comment_count=Count("comments"))
-        .order_by("-pub_date")
+        .order_by(*POST_ORDERING)
     )
     return query_set
 
 
-def post_published_query():
+def publication_now(request=None):
+    # Publication moments are rounded down to PUBLICATION_CLOCK_STEP
+    # seconds, so every feed query issued within one step is identical.
+    # The value is fixed once per request when a request is passed.
+    if request is not None and hasattr(request, "_publication_now"):
+        return request._publication_now
+    step = settings.PUBLICATION_CLOCK_STEP
+    now = timezone.now()
+    if step:
+        seconds = int(now.timestamp())
+        now = datetime.fromtimestamp(seconds - seconds % step, timezone.utc)
+    if request is not None:
+        request._publication_now = now
+    return now
+
+
+def post_published_query(now=None):
     query_set = post_all_query().filter(
-        pub_date__lte=timezone.now(),
+        pub_date__lte=now or publication_now(),
         is_published=True,
         category__is_published=True,
     )
     return query_set
 
 
-def get_post_data(post_data):
-    post = get_object_or_404(
-        Post,
-        pk=post_data["pk"],
-        pub_date__lte=timezone.now(),
-        is_published=True,
-        category__is_published=True,
+def get_request_object(request, klass, **kwargs):
+    # Identity map scoped to a single request: the same lookup never hits
+    # the database twice while the request is being handled.
+    # A queryset is keyed by its SQL as well, so a lookup through a
+    # narrower queryset never gets a row loaded through a wider one.
+    cache = vars(request).setdefault("_object_cache", {})
+    model = getattr(klass, "model", klass)
+    query = str(klass.query) if hasattr(klass, "query") else None
+    key = (model._meta.label, query, tuple(sorted(kwargs.items())))
+    if key not in cache:
+        cache[key] = get_object_or_404(klass, **kwargs)
+    return cache[key]
+
+
+def is_post_published(post, now=None):
+    return all(
+        (
+            post.is_published,
+            post.pub_date <= (now or publication_now()),
+            post.category is not None and post.category.is_published,
+        )
     )
+
+
+def get_post_data(request, post_data):
+    post = get_request_object(request, post_all_query(), pk=post_data["pk"])
+    if not is_post_published(post, publication_now(request)):
+        raise Http404("Публикация не найдена")
     return post
+
+
+def comment_url(comment):
+    url = reverse("blog:post_detail", kwargs={"pk": comment.post_id})
+    return f"{url}?comment={comment.pk}#comment_{comment.pk}"
@@ -0,0 +1,57 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.utils.crypto import constant_time_compare
+from django.http import Http404, HttpResponse
+
+from blog.models import Post
+from core.images import stale_image_variants_filter
+from core.metrics import read_metrics, render_metrics
+from core.models import EmailOutbox
+
+
+def collect_gauges():
+    queued = dict.fromkeys(
+        (EmailOutbox.Status.PENDING, EmailOutbox.Status.FAILED), 0
+    )
+    queued.update(
+        EmailOutbox.objects.filter(status__in=list(queued))
+        .values_list("status")
+        .annotate(total=Count("pk"))
+        .order_by()
+    )
+    return {
+        "outbox_emails": [
+            ({"status": status}, total) for status, total in queued.items()
+        ],
+        "image_backlog_posts": [({}, count_image_backlog())],
+    }
+
+
+def count_image_backlog():
+    # No index fits the stale condition, so the count is shared by all
+    # workers and taken again only after METRICS_IMAGE_BACKLOG_TIMEOUT.
+    return cache.get_or_set(
+        "metrics:image-backlog",
+        lambda: Post.objects.filter(stale_image_variants_filter()).count(),
+        settings.METRICS_IMAGE_BACKLOG_TIMEOUT,
+    )
+
+
+def metrics_view(request):
+    # Meant for a Prometheus scraper holding the token; everyone else
+    # sees an ordinary missing page. A source address proves nothing
+    # behind a reverse proxy on the same host.
+    scheme, _, token = request.META.get("HTTP_AUTHORIZATION", "").partition(
+        " "
+    )
+    if not (
+        settings.METRICS_TOKEN
+        and scheme.lower() == "bearer"
+        and constant_time_compare(token, settings.METRICS_TOKEN)
+    ):
+        raise Http404
+    return HttpResponse(
+        render_metrics(read_metrics(), collect_gauges()),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
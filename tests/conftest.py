@@ -18,7 +18,9 @@ from typing import (
 
 import pytest
 from django.apps import apps
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db.models import Model, Field
 from django.forms import BaseForm
 from django.http import HttpResponse
@@ -26,6 +28,9 @@ from django.test import override_settings
 from django.test.client import Client
 from mixer.backend.django import mixer as _mixer
 
+from core import metrics
+from core.auth import clear_user_cache
+
 N_PER_FIXTURE = 3
 N_PER_PAGE = 10
 COMMENT_TEXT_DISPLAY_LEN_FOR_TESTS = 50
@@ -41,6 +46,39 @@ def enable_debug_false():
         yield
 
 
+@pytest.fixture(autouse=True, scope="session")
+def shared_cache(tmp_path_factory):
+    caches = {
+        "default": {
+            **settings.CACHES["default"],
+            "LOCATION": tmp_path_factory.mktemp("cache"),
+        }
+    }
+    with override_settings(CACHES=caches):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(shared_cache):
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def metrics_store(tmp_path):
+    with override_settings(METRICS_DB_PATH=tmp_path / "metrics.sqlite3"):
+        yield
+        metrics.flush()
+
+
+@pytest.fixture(autouse=True)
+def user_cache():
+    clear_user_cache()
+    yield
+    clear_user_cache()
+
+
 class SafeImportFromContextManager:
     def __init__(
             self,
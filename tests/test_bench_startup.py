@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+
+from core.management.commands.bench_startup import (
+    module_group,
+    parse_importtime,
+)
+
+APPS = ["django.contrib.admin", "blog", "core"]
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _csv
+import time:       300 |        420 | csv
+import time:      1500 |       1500 |     django.contrib.admin.options
+import time:       400 |       1900 |   django.contrib.admin
+import time:       800 |        800 | django.utils.html
+import time:       250 |       1050 | blog.admin
+import time:        50 |         50 | PIL.Image
+"""
+
+# Boots a production worker up to the URLconf, as the first request does.
+LAZY_SCRIPT = """
+import json, sys
+import blogicum.wsgi
+import blogicum.urls
+print(json.dumps(sorted(
+    name for name in ("PIL", "django.utils.feedgenerator", "xml.sax")
+    if name in sys.modules
+)))
+"""
+
+
+def test_module_group():
+    assert module_group("blog.models", APPS) == "blog"
+    assert module_group("blogicum.wsgi", APPS) == "blogicum"
+    assert module_group(
+        "django.contrib.admin.sites", APPS
+    ) == "django.contrib.admin"
+    assert module_group("django.db.models", APPS) == "django"
+    assert module_group("_csv", APPS) == "stdlib"
+    assert module_group("json.decoder", APPS) == "stdlib"
+    assert module_group("PIL.Image", APPS) == "PIL"
+
+
+def test_parse_importtime():
+    assert parse_importtime(IMPORTTIME, APPS) == {
+        "stdlib": 420,
+        "django.contrib.admin": 1900,
+        "django": 800,
+        "blog": 250,
+        "PIL": 50,
+    }, (
+        "Убедитесь, что время импорта суммируется по собственному времени"
+        " модулей и группируется по приложениям."
+    )
+
+
+def test_worker_boot_skips_optional_dependencies():
+    result = subprocess.run(
+        [sys.executable, "-c", LAZY_SCRIPT],
+        env={
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "blogicum.settings.production",
+            "DJANGO_SECRET_KEY": "test-secret-key",
+            "PYTHONPATH": str(settings.BASE_DIR),
+        },
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(result.stdout) == [], (
+        "Убедитесь, что Pillow и генератор лент не загружаются при запуске"
+        " рабочего процесса."
+    )
@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+ROUTES = (
+    "blog:index", "blog:feed", "blog:category_posts", "blog:category_feed",
+    "blog:profile", "blog:profile_feed", "blog:search",
+    "blog:post_detail", "blog:post_comments", "blog:edit_profile",
+    "blog:create_post", "blog:edit_post", "blog:delete_post",
+    "blog:add_comment", "blog:edit_comment", "blog:delete_comment",
+    "pages:about", "pages:rules",
+)
+
+
+@pytest.fixture
+def bench_data():
+    call_command(
+        "seed_bench_data", users=5, posts=30, comments=100, categories=10,
+        locations=3, stdout=None,
+    )
+
+
+def _bench(tmp_path: Path, budgets: dict):
+    budgets_file = tmp_path / "budgets.json"
+    budgets_file.write_text(json.dumps(budgets))
+    report_file = tmp_path / "report.json"
+    call_command(
+        "bench_endpoints", repeat=2, warmup=1, report=report_file,
+        budgets=budgets_file, stdout=None, stderr=None,
+    )
+    return json.loads(report_file.read_text())
+
+
+def test_seed_bench_data(bench_data):
+    assert Post.objects.count() == 30 and Comment.objects.count() == 100
+    post = Post.objects.order_by("-comment_count").first()
+    assert post.comment_count == post.comments.count(), (
+        "Убедитесь, что `seed_bench_data` пересчитывает количество"
+        " комментариев у публикаций."
+    )
+
+
+def test_report_covers_every_route(tmp_path: Path, bench_data):
+    report = _bench(tmp_path, {})
+    assert set(report["endpoints"]) == set(ROUTES), (
+        "Убедитесь, что `bench_endpoints` замеряет все адреса"
+        " приложений blog и pages."
+    )
+    for result in report["endpoints"].values():
+        assert result["status"] == (302 if result["method"] == "POST" else 200)
+        assert result["p95_ms"] >= result["p50_ms"] > 0
+        assert result["queries"] >= 0
+    assert report["endpoints"]["pages:about"]["queries"] == 0, (
+        "Убедитесь, что сессия и пользователь не загружаются из базы"
+        " на каждом запросе."
+    )
+    assert report["endpoints"]["blog:search"]["data"]["q"]
+    assert report["endpoints"]["blog:search"]["queries"] > 0, (
+        "Убедитесь, что поиск замеряется с поисковым запросом."
+    )
+    assert report["endpoints"]["blog:add_comment"]["method"] == "POST", (
+        "Убедитесь, что замеряется отправка комментария."
+    )
+    assert not report["violations"]
+
+
+def test_budget_violation_fails(tmp_path: Path, bench_data):
+    with pytest.raises(CommandError):
+        _bench(tmp_path, {"blog:index": {"queries": 0}})
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["violations"] and report["violations"][0].startswith(
+        "blog:index"
+    )
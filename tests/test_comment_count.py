@@ -0,0 +1,65 @@
+import pytest
+from django.core.management import call_command
+from django.db.models import Model
+from django.test import Client
+from mixer.backend.django import Mixer
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comment_count_follows_comments(
+        mixer: Mixer, post_with_published_location: Model
+):
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend(Comment, post=post)
+    post.refresh_from_db()
+    assert post.comment_count == 3, (
+        "Убедитесь, что при создании комментария увеличивается сохранённое"
+        " количество комментариев публикации."
+    )
+    comments[0].delete()
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        "Убедитесь, что при удалении комментария уменьшается сохранённое"
+        " количество комментариев публикации."
+    )
+    comments[1].author.delete()
+    post.refresh_from_db()
+    assert post.comment_count == 1, (
+        "Убедитесь, что каскадное удаление комментариев уменьшает сохранённое"
+        " количество комментариев публикации."
+    )
+
+
+def test_comment_count_via_views(
+        user_client: Client, another_user_client: Client,
+        post_with_published_location: Model
+):
+    post = post_with_published_location
+    another_user_client.post(
+        f"/posts/{post.id}/comment/", data={"text": "Комментарий"}
+    )
+    post.refresh_from_db()
+    assert post.comment_count == 1
+    comment = Comment.objects.get(post=post)
+    another_user_client.post(
+        f"/posts/{post.id}/delete_comment/{comment.id}/"
+    )
+    post.refresh_from_db()
+    assert post.comment_count == 0
+
+
+def test_recount_comments_command(
+        mixer: Mixer, post_with_published_location: Model
+):
+    post = post_with_published_location
+    mixer.cycle(2).blend(Comment, post=post)
+    Post.objects.update(comment_count=100)
+    call_command("recount_comments", stdout=None)
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        "Убедитесь, что команда `recount_comments` восстанавливает количество"
+        " комментариев публикаций."
+    )
@@ -0,0 +1,103 @@
+import re
+
+import pytest
+from django.db.models import Model
+from django.test import Client
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+N_COMMENTS = 45
+COMMENT_LIMIT = 20
+
+
+@pytest.fixture
+def comments(mixer: Mixer, post_with_published_location: Model):
+    return mixer.cycle(N_COMMENTS).blend(
+        "blog.Comment", post=post_with_published_location
+    )
+
+
+def _shown(content: str):
+    return [int(pk) for pk in re.findall(r'name="comment_(\d+)"', content)]
+
+
+def test_first_page_inlined(
+        unlogged_client: Client, post_with_published_location: Model,
+        comments: list
+):
+    content = unlogged_client.get(
+        f"/posts/{post_with_published_location.id}/"
+    ).content.decode("utf-8")
+    assert _shown(content) == [c.id for c in comments[:COMMENT_LIMIT]], (
+        "Убедитесь, что на странице поста выводится только первая страница"
+        " комментариев."
+    )
+    assert "data-fragment-url" in content
+
+
+def test_next_pages_are_fragments(
+        unlogged_client: Client, post_with_published_location: Model,
+        comments: list
+):
+    url = f"/posts/{post_with_published_location.id}/"
+    content = unlogged_client.get(url).content.decode("utf-8")
+    shown = []
+    while True:
+        fragment_url = re.search(r'data-fragment-url="([^"]+)"', content)
+        if not fragment_url:
+            break
+        content = unlogged_client.get(
+            fragment_url.group(1).replace("&amp;", "&")
+        ).content.decode("utf-8")
+        assert "<html" not in content
+        shown += _shown(content)
+    assert shown == [c.id for c in comments[COMMENT_LIMIT:]], (
+        "Убедитесь, что следующие страницы комментариев загружаются"
+        " фрагментами по курсору."
+    )
+
+
+def test_comment_anchor_opens_its_page(
+        unlogged_client: Client, post_with_published_location: Model,
+        comments: list
+):
+    comment = comments[30]
+    content = unlogged_client.get(
+        f"/posts/{post_with_published_location.id}/",
+        {"comment": comment.id},
+    ).content.decode("utf-8")
+    assert _shown(content) == [
+        c.id for c in comments[COMMENT_LIMIT:2 * COMMENT_LIMIT]
+    ], (
+        "Убедитесь, что ссылка на комментарий открывает страницу"
+        " комментариев, на которой он находится."
+    )
+
+
+def test_new_comment_redirects_to_anchor(
+        user_client: Client, post_with_published_location: Model,
+        comments: list
+):
+    response = user_client.post(
+        f"/posts/{post_with_published_location.id}/comment/",
+        {"text": "Новый комментарий"},
+    )
+    comment = post_with_published_location.comments.latest("id")
+    assert response["Location"].endswith(
+        f"?comment={comment.id}#comment_{comment.id}"
+    )
+    content = user_client.get(response["Location"]).content.decode("utf-8")
+    assert comment.id in _shown(content)
+
+
+def test_fragment_of_hidden_post(
+        unlogged_client: Client, post_with_published_location: Model,
+        comments: list
+):
+    post_with_published_location.is_published = False
+    post_with_published_location.save()
+    response = unlogged_client.get(
+        f"/posts/{post_with_published_location.id}/comments/"
+    )
+    assert response.status_code == 404
@@ -0,0 +1,117 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.db.models import Model
+from django.test import Client
+from django.utils import timezone
+from django.utils.http import http_date
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _page_urls(post: Model):
+    return (
+        "/",
+        f"/category/{post.category.slug}/",
+        f"/profile/{post.author.username}/",
+        f"/posts/{post.id}/",
+    )
+
+
+def test_revalidation_returns_not_modified(
+        unlogged_client: Client, post_with_published_location: Model
+):
+    for url in _page_urls(post_with_published_location):
+        response = unlogged_client.get(url)
+        assert response["ETag"] and response["Last-Modified"]
+        assert "no-cache" in response["Cache-Control"]
+        revalidated = unlogged_client.get(
+            url, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        assert revalidated.status_code == 304, (
+            f"Убедитесь, что страница `{url}` отвечает 304 Not Modified,"
+            " если она не изменилась."
+        )
+        assert not revalidated.content
+        since = unlogged_client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        assert since.status_code == 304
+
+
+def test_comment_changes_validators(
+        mixer: Mixer, unlogged_client: Client,
+        post_with_published_location: Model
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    etag = unlogged_client.get(url)["ETag"]
+    updated_at = post.updated_at
+    mixer.blend("blog.Comment", post=post)
+    post.refresh_from_db()
+    assert post.updated_at > updated_at, (
+        "Убедитесь, что новый комментарий обновляет `Post.updated_at`."
+    )
+    response = unlogged_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200 and response["ETag"] != etag
+
+
+def test_validators_depend_on_user(
+        user_client: Client, unlogged_client: Client,
+        post_with_published_location: Model
+):
+    url = f"/posts/{post_with_published_location.id}/"
+    etag = unlogged_client.get(url)["ETag"]
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert "private" in response["Cache-Control"]
+
+
+def test_validators_follow_data_not_clock(
+        mixer: Mixer, unlogged_client: Client,
+        post_with_published_location: Model
+):
+    post = post_with_published_location
+    now = timezone.now()
+    scheduled = mixer.blend(
+        "blog.Post", category=post.category, author=post.author,
+        is_published=True, pub_date=now + timedelta(seconds=90),
+    )
+    past = now - timedelta(days=2)
+    Post.objects.filter(pk=post.pk).update(pub_date=past, updated_at=past)
+    cache.clear()
+    response = unlogged_client.get("/")
+    assert response["Last-Modified"] == http_date(past.timestamp()), (
+        "Убедитесь, что Last-Modified — время последнего изменения"
+        " показанных публикаций, а не текущее время."
+    )
+    with mock.patch(
+            "django.utils.timezone.now",
+            return_value=now + timedelta(seconds=60),
+    ):
+        revalidated = unlogged_client.get(
+            "/", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+    assert revalidated.status_code == 304, (
+        "Убедитесь, что ETag не меняется со временем, пока данные"
+        " на странице прежние."
+    )
+    with mock.patch(
+            "django.utils.timezone.now",
+            return_value=now + timedelta(seconds=120),
+    ):
+        published = unlogged_client.get(
+            "/", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+    assert published.status_code == 200, (
+        "Убедитесь, что отложенная публикация меняет ETag, когда наступает"
+        " её время."
+    )
+    assert published["Last-Modified"] == http_date(
+        scheduled.pub_date.timestamp()
+    )
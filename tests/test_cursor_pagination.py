@@ -0,0 +1,72 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _walk(client: Client, url: str, direction: str, start_query: str = ""):
+    ids, query = [], start_query
+    for _ in range(10):
+        page = client.get(f"{url}{query}").context["page_obj"]
+        chunk = [post.id for post in page]
+        ids = chunk + ids if direction == "before" else ids + chunk
+        cursor = (
+            page.previous_cursor if direction == "before"
+            else page.next_cursor
+        )
+        if cursor is None:
+            return ids
+        query = f"?{direction}={cursor}"
+    raise AssertionError("Пагинация не завершилась за ожидаемое число шагов.")
+
+
+def test_cursor_walk_covers_feed(
+        user_client: Client, many_posts_with_published_locations
+):
+    expected = [
+        post.id for post in sorted(
+            many_posts_with_published_locations,
+            key=lambda post: (post.pub_date, post.id),
+            reverse=True,
+        )
+    ]
+    assert _walk(user_client, "/", "after") == expected, (
+        "Убедитесь, что переход по ссылкам `?after=` обходит всю ленту"
+        " без пропусков и повторов."
+    )
+    assert _walk(user_client, "/", "before", "?page=last") == expected, (
+        "Убедитесь, что переход по ссылкам `?before=` с последней страницы"
+        " обходит всю ленту без пропусков и повторов."
+    )
+
+
+def test_legacy_page_numbers(
+        user_client: Client, many_posts_with_published_locations
+):
+    first = list(user_client.get("/").context["page_obj"])
+    second = list(user_client.get("/?page=2").context["page_obj"])
+    assert len(second) == N_PER_PAGE
+    assert not set(first) & set(second), (
+        "Убедитесь, что старые ссылки вида `?page=N` продолжают работать."
+    )
+    assert user_client.get("/?page=100").status_code == HTTPStatus.NOT_FOUND
+    assert user_client.get("/?after=garbage").status_code == (
+        HTTPStatus.NOT_FOUND
+    )
+
+
+def test_feed_does_not_count_rows(
+        user_client: Client, many_posts_with_published_locations
+):
+    cursor = user_client.get("/").context["page_obj"].next_cursor
+    with CaptureQueriesContext(connection) as queries:
+        user_client.get(f"/?after={cursor}")
+    assert not any(
+        "COUNT(" in query["sql"].upper() for query in queries.captured_queries
+    ), "Убедитесь, что пагинация ленты не выполняет запрос `COUNT(*)`."
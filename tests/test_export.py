@@ -0,0 +1,109 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+import pytz
+from django.core.management import CommandError, call_command
+from django.db.models import Model
+from django.test import Client
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+URL = "/admin/blog/post/export/"
+
+
+@pytest.fixture
+def posts(mixer: Mixer, user: Model, published_category: Model,
+          another_category: Model):
+    dates = (
+        datetime(2023, 1, day, 12, tzinfo=pytz.UTC) for day in range(1, 7)
+    )
+    posts = mixer.cycle(6).blend(
+        "blog.Post",
+        author=user,
+        pub_date=dates,
+        category=mixer.sequence(published_category, another_category),
+    )
+    mixer.cycle(4).blend("blog.Comment", post=posts[0], author=user)
+    return posts
+
+
+def _export(tmp_path: Path, *args, **options):
+    output = tmp_path / "export"
+    call_command("export_data", *args, output=str(output), **options)
+    return output.read_bytes()
+
+
+def test_export_posts_ndjson(tmp_path: Path, posts):
+    lines = _export(tmp_path, "posts").decode("utf-8").splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [row["id"] for row in rows] == [post.id for post in posts]
+    first = rows[0]
+    assert first["author"] == posts[0].author.username
+    assert first["category"] == posts[0].category.slug
+    assert first["comment_count"] == 4
+    assert first["pub_date"].startswith("2023-01-01T12:00:00")
+
+
+def test_export_filters(tmp_path: Path, posts, published_category: Model):
+    rows = [
+        json.loads(line) for line in _export(
+            tmp_path, "posts", date_from="2023-01-02", date_to="2023-01-04",
+            category=published_category.slug,
+        ).splitlines()
+    ]
+    assert [row["id"] for row in rows] == [posts[2].id], (
+        "Убедитесь, что выгрузку можно ограничить диапазоном дат"
+        " и категорией."
+    )
+    with pytest.raises(CommandError):
+        _export(tmp_path, "posts", date_from="2023-01-04",
+                date_to="2023-01-02")
+
+
+def test_export_comments_csv_gzip(tmp_path: Path, posts):
+    content = gzip.decompress(
+        _export(tmp_path, "comments", format="csv", compress=True)
+    )
+    rows = list(csv.DictReader(io.StringIO(content.decode("utf-8"))))
+    assert len(rows) == 4
+    assert {row["post"] for row in rows} == {str(posts[0].id)}
+    assert list(rows[0]) == ["id", "post", "author", "text", "created_at"]
+
+
+def test_export_view(admin_client: Client, user_client: Client, posts):
+    response = admin_client.get(
+        f"{URL}posts/", {"format": "csv", "compress": "on"}
+    )
+    assert response.status_code == 200 and response.streaming, (
+        "Убедитесь, что выгрузка для сотрудников отдаётся потоком."
+    )
+    assert response["Content-Disposition"].endswith('posts.csv.gz"')
+    content = gzip.decompress(b"".join(response.streaming_content))
+    rows = list(csv.reader(io.StringIO(content.decode("utf-8"))))
+    assert len(rows) == len(posts) + 1
+    assert admin_client.get(
+        f"{URL}posts/", {"date_from": "вчера"}
+    ).status_code == 400
+    assert admin_client.get(f"{URL}users/").status_code == 404
+    response = user_client.get(f"{URL}comments/")
+    assert response.status_code == 302, (
+        "Убедитесь, что выгрузка недоступна пользователям без статуса"
+        " сотрудника."
+    )
+
+
+def test_export_empty_csv(tmp_path: Path):
+    content = _export(
+        tmp_path, "posts", format="csv",
+        date_from=str((datetime.now() + timedelta(days=1)).date()),
+    )
+    assert content.decode("utf-8").splitlines() == [
+        "id,title,text,pub_date,is_published,author,category,location,"
+        "comment_count,created_at"
+    ]
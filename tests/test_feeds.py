@@ -0,0 +1,116 @@
+from xml.etree import ElementTree
+
+import pytest
+from django.core.cache import cache
+from django.db.models import Model
+from django.test import Client
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+def _get_feed(client: Client, url: str):
+    response = client.get(url)
+    assert response.status_code == 200, (
+        f"Убедитесь, что лента `{url}` доступна."
+    )
+    assert response.streaming, (
+        f"Убедитесь, что лента `{url}` отдаётся потоком."
+    )
+    return response, ElementTree.fromstring(
+        b"".join(response.streaming_content)
+    )
+
+
+def _atom_titles(root):
+    return {entry.findtext(f"{ATOM}title") for entry in root.iter(
+        f"{ATOM}entry"
+    )}
+
+
+def test_atom_feed(
+        unlogged_client: Client, post_with_published_location: Model,
+        unpublished_posts_with_published_locations, future_posts
+):
+    response, root = _get_feed(unlogged_client, "/feed/atom/")
+    assert response["Content-Type"].startswith("application/atom+xml")
+    assert _atom_titles(root) == {post_with_published_location.title}, (
+        "Убедитесь, что в ленту попадают только опубликованные публикации."
+    )
+
+
+def test_rss_feed(
+        unlogged_client: Client, post_with_published_location: Model,
+        posts_with_unpublished_category
+):
+    response, root = _get_feed(unlogged_client, "/feed/rss/")
+    assert response["Content-Type"].startswith("application/rss+xml")
+    assert root.tag == "rss"
+    titles = [item.findtext("title") for item in root.iter("item")]
+    assert titles == [post_with_published_location.title]
+
+
+def test_category_and_profile_feeds(
+        unlogged_client: Client, post_with_published_location: Model,
+        post_with_another_category: Model, post_of_another_author: Model
+):
+    post = post_with_published_location
+    _, root = _get_feed(
+        unlogged_client, f"/category/{post.category.slug}/feed/atom/"
+    )
+    assert _atom_titles(root) == {post.title, post_of_another_author.title}
+    _, root = _get_feed(
+        unlogged_client, f"/profile/{post.author.username}/feed/atom/"
+    )
+    assert _atom_titles(root) == {
+        post.title, post_with_another_category.title
+    }
+
+
+def test_feed_not_found(
+        mixer: Mixer, unlogged_client: Client,
+        post_with_published_location: Model
+):
+    category = mixer.blend("blog.Category", is_published=False)
+    for url in (
+        "/feed/json/",
+        f"/category/{category.slug}/feed/atom/",
+        "/profile/nobody/feed/atom/",
+    ):
+        assert unlogged_client.get(url).status_code == 404, (
+            f"Убедитесь, что адрес `{url}` возвращает ошибку 404."
+        )
+
+
+def test_feed_is_cached_and_revalidated(
+        unlogged_client: Client, post_with_published_location: Model
+):
+    response, _ = _get_feed(unlogged_client, "/feed/atom/")
+    assert response["ETag"] and response["Last-Modified"]
+    cached = unlogged_client.get("/feed/atom/")
+    assert not cached.streaming, (
+        "Убедитесь, что повторный запрос ленты отдаётся из кеша."
+    )
+    assert _atom_titles(ElementTree.fromstring(cached.content)) == {
+        post_with_published_location.title
+    }
+    revalidated = unlogged_client.get(
+        "/feed/atom/", HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+    assert revalidated.status_code == 304
+
+
+def test_feed_updated_is_newest_post_change(
+        unlogged_client: Client, post_with_published_location: Model
+):
+    post = post_with_published_location
+    post.refresh_from_db()
+    cache.clear()
+    _, root = _get_feed(unlogged_client, "/feed/atom/")
+    newest = max(post.updated_at, post.pub_date).replace(microsecond=0)
+    assert root.findtext(f"{ATOM}updated") == newest.isoformat(), (
+        "Убедитесь, что время обновления ленты — время последнего"
+        " изменения публикаций в ней."
+    )
@@ -0,0 +1,98 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+
+from blog.management.commands.import_fixture import Command
+from blog.models import Category, Comment, Location, Post, User
+from core.fixtures import iter_json_array
+
+pytestmark = [pytest.mark.django_db]
+
+FIXTURE = Path(__file__).resolve().parent.parent / "db.json"
+
+
+@pytest.fixture
+def fixture_with_comments(tmp_path: Path):
+    objects = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    objects.extend(
+        {
+            "model": "blog.comment",
+            "pk": pk,
+            "fields": {
+                "text": f"Комментарий {pk}",
+                "post": 1,
+                "author": 1,
+                "created_at": "2022-12-19T10:00:00Z",
+            },
+        }
+        for pk in range(1, 26)
+    )
+    # Comments before posts and posts before their authors, the way a
+    # hand-edited export may look.
+    objects.sort(key=lambda item: item["model"] != "blog.comment")
+    path = tmp_path / "export.json"
+    path.write_text(json.dumps(objects, ensure_ascii=False, indent=2))
+    return path
+
+
+def test_iter_json_array_reads_in_chunks():
+    text = FIXTURE.read_text(encoding="utf-8")
+    assert list(
+        iter_json_array(io.StringIO(text), chunk_size=7)
+    ) == json.loads(text)
+    assert list(iter_json_array(io.StringIO(" [ ] "))) == []
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO('[{"model": "blog.post"'), 4))
+
+
+def test_import_fixture(fixture_with_comments: Path):
+    call_command(
+        "import_fixture", fixture_with_comments, batch_size=10,
+        stdout=io.StringIO(),
+    )
+    assert (
+        Category.objects.count(), Location.objects.count(),
+        User.objects.count(), Post.objects.count(),
+        Comment.objects.count(),
+    ) == (6, 12, 4, 39, 25)
+    assert Post.objects.get(pk=1).comment_count == 25, (
+        "Убедитесь, что после загрузки пересчитывается количество"
+        " комментариев у публикаций."
+    )
+    assert not fixture_with_comments.with_name("export.json.import").exists()
+
+
+def test_import_fixture_resumes(
+        monkeypatch, fixture_with_comments: Path
+):
+    insert = Command.insert
+    calls = []
+
+    def failing_insert(self, model, batch, ignore_conflicts):
+        if model is Post and calls:
+            raise RuntimeError("Обрыв загрузки")
+        if model is Post:
+            calls.append(batch)
+        insert(self, model, batch, ignore_conflicts)
+
+    monkeypatch.setattr(Command, "insert", failing_insert)
+    with pytest.raises(RuntimeError):
+        call_command(
+            "import_fixture", fixture_with_comments, batch_size=10,
+            stdout=io.StringIO(),
+        )
+    checkpoint = fixture_with_comments.with_name("export.json.import")
+    progress = json.loads(checkpoint.read_text())["progress"]
+    assert progress["blog.post"] == 10 and progress["blog.category"] == -1
+    assert Post.objects.count() == 10
+    monkeypatch.setattr(Command, "insert", insert)
+    stdout = io.StringIO()
+    call_command(
+        "import_fixture", fixture_with_comments, batch_size=10,
+        stdout=stdout,
+    )
+    assert "Загружено строк: 54" in stdout.getvalue()
+    assert Post.objects.count() == 39 and Comment.objects.count() == 25
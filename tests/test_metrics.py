@@ -0,0 +1,113 @@
+import multiprocessing
+
+import pytest
+from django.db.models import Model
+from django.test import Client
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+from core import metrics
+
+pytestmark = [pytest.mark.django_db]
+
+URL = "/internal/metrics"
+TOKEN = "scraper-token"
+
+
+@pytest.fixture(autouse=True)
+def metrics_token(settings):
+    settings.METRICS_TOKEN = TOKEN
+
+
+def _samples(client: Client):
+    response = client.get(URL, HTTP_AUTHORIZATION=f"Bearer {TOKEN}")
+    assert response.status_code == 200, (
+        f"Убедитесь, что адрес `{URL}` доступен с токеном METRICS_TOKEN."
+    )
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    return dict(
+        line.rsplit(" ", 1)
+        for line in response.content.decode("utf-8").splitlines()
+        if not line.startswith("#")
+    )
+
+
+def test_request_metrics(
+        client: Client, post_with_published_location: Model
+):
+    for _ in range(2):
+        client.get("/")
+    samples = _samples(client)
+    view = 'view="blog:index"'
+    assert samples[
+        f'blogicum_http_requests_total{{method="GET",status="200",{view}}}'
+    ] == "2"
+    assert samples[
+        f'blogicum_http_request_duration_seconds_bucket{{le="+Inf",{view}}}'
+    ] == samples[f"blogicum_http_request_duration_seconds_count{{{view}}}"]
+    assert int(samples[f"blogicum_db_queries_total{{{view}}}"]) > 0
+    assert samples['blogicum_page_cache_requests_total{outcome="hits"}'] == "1"
+    assert samples[
+        'blogicum_page_cache_requests_total{outcome="misses"}'
+    ] == "1"
+
+
+def test_queue_gauges(
+        mixer: Mixer, client: Client, post_with_published_location: Model
+):
+    mixer.cycle(2).blend("core.EmailOutbox", status="pending")
+    mixer.blend("core.EmailOutbox", status="sent")
+    Post.objects.filter(
+        pk=post_with_published_location.pk
+    ).update(image="posts_images/missing.jpg", image_variants=None)
+    samples = _samples(client)
+    assert samples['blogicum_outbox_emails{status="pending"}'] == "2"
+    assert samples['blogicum_outbox_emails{status="failed"}'] == "0"
+    assert samples["blogicum_image_backlog_posts"] == "1"
+
+
+def test_metrics_require_token(settings, client: Client):
+    assert client.get(URL).status_code == 404, (
+        "Убедитесь, что метрики не отдаются без токена, даже с локального"
+        " адреса."
+    )
+    assert client.get(
+        URL, HTTP_AUTHORIZATION="Bearer wrong-token"
+    ).status_code == 404
+    settings.METRICS_TOKEN = ""
+    assert client.get(URL, HTTP_AUTHORIZATION="Bearer ").status_code == 404
+
+
+def test_image_backlog_is_counted_once(
+        django_assert_num_queries, client: Client,
+        post_with_published_location: Model
+):
+    _samples(client)
+    Post.objects.filter(
+        pk=post_with_published_location.pk
+    ).update(image="posts_images/missing.jpg", image_variants=None)
+    # Only the outbox counts run on the next scrape.
+    with django_assert_num_queries(1):
+        samples = _samples(client)
+    assert samples["blogicum_image_backlog_posts"] == "0"
+
+
+def _worker_requests():
+    metrics.inc("http_requests_total", 3, view="pages:about")
+    metrics.flush()
+
+
+def test_workers_share_store(client: Client):
+    metrics.inc("http_requests_total", 2, view="pages:about")
+    worker = multiprocessing.get_context("fork").Process(
+        target=_worker_requests
+    )
+    worker.start()
+    worker.join()
+    assert worker.exitcode == 0
+    assert _samples(client)[
+        'blogicum_http_requests_total{view="pages:about"}'
+    ] == "5", (
+        "Убедитесь, что метрики всех рабочих процессов собираются"
+        " в общем хранилище."
+    )
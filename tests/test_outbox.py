@@ -0,0 +1,81 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.db.models import Model
+from django.test import Client, override_settings
+from django.utils import timezone
+
+from core.models import EmailOutbox
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def queued_email(
+        another_user_client: Client, post_with_published_location: Model
+):
+    post = post_with_published_location
+    post.author.email = "author@example.com"
+    post.author.save()
+    another_user_client.post(
+        f"/posts/{post.id}/comment/", data={"text": "Комментарий"}
+    )
+    return EmailOutbox.objects.get()
+
+
+def test_comment_queues_email(queued_email):
+    assert not mail.outbox, (
+        "Убедитесь, что письмо автору публикации не отправляется во время"
+        " запроса на создание комментария."
+    )
+    assert queued_email.recipient == "author@example.com"
+    assert queued_email.status == EmailOutbox.Status.PENDING
+
+
+def test_send_outbox_delivers(queued_email):
+    call_command("send_outbox", stdout=None)
+    queued_email.refresh_from_db()
+    assert queued_email.status == EmailOutbox.Status.SENT
+    assert len(mail.outbox) == 1
+    assert mail.outbox[0].to == ["author@example.com"]
+
+
+@override_settings(OUTBOX_MAX_ATTEMPTS=2)
+def test_send_outbox_retries_with_backoff(queued_email):
+    with mock.patch(
+            "core.outbox.EmailMessage.send", side_effect=OSError("down")
+    ):
+        call_command("send_outbox", stdout=None)
+        queued_email.refresh_from_db()
+        assert queued_email.status == EmailOutbox.Status.PENDING
+        assert queued_email.attempts == 1
+        assert queued_email.next_attempt_at > timezone.now(), (
+            "Убедитесь, что неудачная отправка откладывается."
+        )
+
+        EmailOutbox.objects.update(
+            next_attempt_at=timezone.now() - timedelta(seconds=1)
+        )
+        call_command("send_outbox", stdout=None)
+        queued_email.refresh_from_db()
+    assert queued_email.status == EmailOutbox.Status.FAILED
+    assert "down" in queued_email.last_error
+
+
+def test_send_outbox_survives_connection_failure(queued_email):
+    with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.open",
+            side_effect=OSError("refused"),
+    ):
+        call_command("send_outbox", stdout=None)
+    queued_email.refresh_from_db()
+    assert queued_email.status == EmailOutbox.Status.PENDING
+    assert queued_email.attempts == 1
+    assert queued_email.next_attempt_at > timezone.now(), (
+        "Убедитесь, что письма откладываются, если не удалось подключиться"
+        " к почтовому серверу."
+    )
+    assert "refused" in queued_email.last_error
@@ -0,0 +1,166 @@
+import multiprocessing
+from unittest import mock
+
+import pytest
+from django.core.cache import cache, caches
+from django.db.models import Model
+from django.test import Client
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+from core.cache import (
+    get_group_versions, invalidate_page_groups, page_cache_stats
+)
+from core.filecache import FileBasedCache
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _get(client: Client, url: str):
+    before = page_cache_stats()
+    content = client.get(url).content.decode("utf-8")
+    after = page_cache_stats()
+    return content, after["hits"] - before["hits"] == 1
+
+
+def _page_urls(post: Model):
+    return (
+        "/",
+        f"/category/{post.category.slug}/",
+        f"/profile/{post.author.username}/",
+        f"/posts/{post.id}/",
+    )
+
+
+def test_anonymous_pages_are_cached(
+        unlogged_client: Client, user_client: Client,
+        post_with_published_location: Model
+):
+    for url in _page_urls(post_with_published_location):
+        first, first_hit = _get(unlogged_client, url)
+        second, second_hit = _get(unlogged_client, url)
+        assert not first_hit and second_hit, (
+            f"Убедитесь, что страница `{url}` для анонимного пользователя"
+            " отдаётся из кеша при повторном запросе."
+        )
+        assert first == second
+        _get(user_client, url)
+        assert not _get(user_client, url)[1], (
+            "Убедитесь, что страницы авторизованных пользователей"
+            " не кешируются."
+        )
+
+
+def test_post_change_invalidates_its_pages(
+        unlogged_client: Client, post_with_published_location: Model,
+        post_with_another_category: Model
+):
+    post = post_with_published_location
+    other_category_url = (
+        f"/category/{post_with_another_category.category.slug}/"
+    )
+    for url in (*_page_urls(post), other_category_url):
+        _get(unlogged_client, url)
+
+    post.title = "Новый заголовок публикации"
+    post.save()
+
+    for url in _page_urls(post):
+        content, hit = _get(unlogged_client, url)
+        assert not hit and post.title in content, (
+            f"Убедитесь, что после изменения публикации страница `{url}`"
+            " перестраивается."
+        )
+    assert _get(unlogged_client, other_category_url)[1], (
+        "Убедитесь, что изменение публикации не сбрасывает кеш страниц,"
+        " на которых она не отображается."
+    )
+
+
+def test_comment_invalidates_post_page(
+        mixer: Mixer, unlogged_client: Client,
+        post_with_published_location: Model
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    _get(unlogged_client, url)
+    comment = mixer.blend("blog.Comment", post=post, text="Свежий отзыв")
+    content, hit = _get(unlogged_client, url)
+    assert not hit and comment.text in content, (
+        "Убедитесь, что новый комментарий сбрасывает кеш страницы поста."
+    )
+
+
+def test_category_unpublish_invalidates_post_page(
+        unlogged_client: Client, post_with_published_location: Model
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    _get(unlogged_client, url)
+    post.category.is_published = False
+    post.category.save()
+    assert unlogged_client.get(url).status_code == 404
+
+
+def _worker_invalidates_index():
+    invalidate_page_groups(["index"])
+
+
+def test_workers_share_page_cache(unlogged_client: Client):
+    _get(unlogged_client, "/")
+    assert _get(unlogged_client, "/")[1]
+    versions = get_group_versions(["index"])
+    worker = multiprocessing.get_context("fork").Process(
+        target=_worker_invalidates_index
+    )
+    worker.start()
+    worker.join()
+    assert worker.exitcode == 0
+    assert get_group_versions(["index"]) != versions
+    assert not _get(unlogged_client, "/")[1], (
+        "Убедитесь, что кеш страниц общий для всех рабочих процессов:"
+        " сброс в одном процессе виден в остальных."
+    )
+
+
+@pytest.mark.parametrize("change", ["category", "location", "author"])
+def test_related_row_change_invalidates_pages_without_fan_out(
+        change: str, mixer: Mixer, unlogged_client: Client,
+        post_with_published_location: Model
+):
+    post = post_with_published_location
+    mixer.cycle(20).blend(
+        "blog.Post", category=post.category, location=post.location,
+        author=post.author,
+    )
+    for url in _page_urls(post):
+        _get(unlogged_client, url)
+    row = post.author if change == "author" else getattr(post, change)
+    with mock.patch.object(
+            cache, "set_many", wraps=cache.set_many
+    ) as set_many:
+        row.save()
+    written = {key for call in set_many.call_args_list for key in call[0][0]}
+    assert 0 < len(written) <= 3, (
+        "Убедитесь, что изменение категории, местоположения или автора"
+        " не записывает отдельный токен для каждой публикации."
+    )
+    for url in _page_urls(Post.objects.get(pk=post.pk)):
+        assert not _get(unlogged_client, url)[1], (
+            f"Убедитесь, что после изменения ({change}) страница `{url}`"
+            " перестраивается."
+        )
+
+
+def test_file_cache_culls_at_most_once_per_interval(tmp_path):
+    backend = FileBasedCache(tmp_path, {"OPTIONS": {"CULL_INTERVAL": 60}})
+    with mock.patch.object(
+            backend, "_list_cache_files", wraps=backend._list_cache_files
+    ) as list_files:
+        for index in range(5):
+            backend.set(f"key-{index}", index)
+    assert list_files.call_count == 1, (
+        "Убедитесь, что запись в файловый кеш не перечисляет весь каталог"
+        " кеша при каждой записи."
+    )
+    assert isinstance(caches["default"], FileBasedCache)
@@ -0,0 +1,66 @@
+import pytest
+from django.core.management import call_command
+from django.db.models import Model
+from django.test import Client
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _card_on_pages(client: Client, post: Model, text: str):
+    return [
+        text in client.get(url).content.decode("utf-8")
+        for url in (
+            "/",
+            f"/category/{post.category.slug}/",
+            f"/profile/{post.author.username}/",
+        )
+    ]
+
+
+def test_post_card_is_cached(
+        user_client: Client, post_with_published_location: Model
+):
+    post = post_with_published_location
+    user_client.get("/")
+    Post.objects.filter(pk=post.pk).update(title="Обновлённый заголовок")
+    assert not any(
+        _card_on_pages(user_client, post, "Обновлённый заголовок")
+    ), "Убедитесь, что карточка публикации берётся из кеша фрагментов."
+
+
+@pytest.mark.parametrize(
+    "change", ["post", "category", "location", "author", "comment"]
+)
+def test_post_card_cache_follows_changes(
+        change: str, mixer: Mixer, user_client: Client,
+        post_with_published_location: Model
+):
+    post = post_with_published_location
+    user_client.get("/")
+    if change == "post":
+        post.title = text = "Обновлённый заголовок"
+        post.save()
+    elif change == "category":
+        post.category.title = text = "Новая категория"
+        post.category.save()
+    elif change == "location":
+        post.location.name = text = "Новое место"
+        post.location.save()
+    elif change == "author":
+        post.author.username = text = "new_author_name"
+        post.author.save()
+    else:
+        mixer.blend("blog.Comment", post=post)
+        text = "Комментарии\n        (1)"
+    assert all(_card_on_pages(user_client, post, text)), (
+        f"Убедитесь, что изменение ({change}) сбрасывает кеш карточки"
+        " публикации."
+    )
+
+
+def test_bench_post_cards_command(capsys):
+    call_command("bench_post_cards", repeat=2)
+    assert "Прогретый кеш" in capsys.readouterr().out
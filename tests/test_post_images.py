@@ -0,0 +1,76 @@
+from io import BytesIO
+
+import pytest
+from bs4 import BeautifulSoup
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db.models import Model
+from django.test import Client
+from PIL import Image
+
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def post_with_large_image(post_with_published_location: Model):
+    image_data = BytesIO()
+    Image.new("RGB", (2000, 1000)).save(image_data, "JPEG")
+    post = post_with_published_location
+    post.image = SimpleUploadedFile(
+        "large_image.jpg", image_data.getvalue(), content_type="image/jpeg"
+    )
+    post.save()
+    return post
+
+
+def test_variants_created_on_save(post_with_large_image: Model):
+    variants = post_with_large_image.image_variants
+    assert variants and variants["source"] == (
+        post_with_large_image.image.name
+    ), "Убедитесь, что при сохранении публикации создаются копии изображения."
+    storage = post_with_large_image.image.storage
+    for name, width in (("thumb", 100), ("card", 640), ("detail", 1280)):
+        variant = variants["sizes"][name]
+        assert (variant["width"], variant["height"]) == (width, width // 2)
+        assert storage.exists(variant["name"])
+
+
+@pytest.mark.parametrize("url", ["/", "/posts/{id}/"])
+def test_templates_use_srcset(
+        url: str, user_client: Client, post_with_large_image: Model
+):
+    content = user_client.get(url.format(id=post_with_large_image.id))
+    img = BeautifulSoup(content.content, features="html.parser").find(
+        "img", srcset=True
+    )
+    assert img is not None, (
+        "Убедитесь, что изображение публикации выводится с атрибутом `srcset`."
+    )
+    assert "640w" in img["srcset"] and "1280w" in img["srcset"]
+    assert img["width"] and img["height"] and img["sizes"]
+
+
+def test_backfill_command(post_with_large_image: Model):
+    Post.objects.update(image_variants=None)
+    call_command("generate_post_images", stdout=None)
+    post_with_large_image.refresh_from_db()
+    assert post_with_large_image.image_variants, (
+        "Убедитесь, что команда `generate_post_images` создаёт копии"
+        " изображений существующих публикаций."
+    )
+
+
+def test_unreadable_image_falls_back(
+        user_client: Client, post_with_published_location: Model
+):
+    Post.objects.filter(pk=post_with_published_location.pk).update(
+        image="images/missing.jpg", image_variants=None
+    )
+    post = Post.objects.get(pk=post_with_published_location.pk)
+    post.save()
+    post.refresh_from_db()
+    assert post.image_variants is None
+    response = user_client.get(f"/posts/{post.id}/")
+    assert 'src="/images/missing.jpg"' in response.content.decode("utf-8")
@@ -0,0 +1,41 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.db.models import Model
+from django.test import Client, override_settings
+from django.utils import timezone
+
+from core.utils import publication_now
+
+pytestmark = [pytest.mark.django_db]
+
+
+@override_settings(PUBLICATION_CLOCK_STEP=30)
+def test_publication_clock_is_quantized():
+    now = timezone.now()
+    clock = publication_now()
+    assert clock <= now and now - clock < timedelta(seconds=30)
+    assert clock.timestamp() % 30 == 0, (
+        "Убедитесь, что время публикации округляется до шага"
+        " `PUBLICATION_CLOCK_STEP`."
+    )
+
+
+def test_scheduled_post_appears_without_restart(
+        unlogged_client: Client, post_with_published_location: Model
+):
+    post = post_with_published_location
+    post.pub_date = timezone.now() + timedelta(hours=1)
+    post.save()
+    assert post not in unlogged_client.get("/").context["page_obj"]
+
+    later = timezone.now() + timedelta(hours=2)
+    with mock.patch("django.utils.timezone.now", return_value=later):
+        page = unlogged_client.get("/").context["page_obj"]
+        detail = unlogged_client.get(f"/posts/{post.id}/")
+    assert post in page, (
+        "Убедитесь, что отложенная публикация появляется на главной"
+        " странице, когда наступает время её публикации."
+    )
+    assert detail.status_code == 200
@@ -0,0 +1,89 @@
+import pytest
+from django.db.models import Model
+from django.http import Http404
+from django.test import Client
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+from core.utils import get_request_object
+
+pytestmark = [pytest.mark.django_db]
+
+# The session is a signed cookie and costs nothing; a worker loads the
+# user once and then serves it from its cache (see test_user_cache).
+# Everything above that is the view itself.
+SESSION_QUERIES = 1
+
+
+@pytest.fixture
+def comment_by_another_user(
+        mixer: Mixer, post_with_published_location: Model,
+        another_user: Model
+):
+    return mixer.blend(
+        "blog.Comment", post=post_with_published_location,
+        author=another_user,
+    )
+
+
+@pytest.mark.parametrize(
+    ("client_name", "url", "view_queries"),
+    [
+        ("unlogged_client", "/", 1),
+        ("user_client", "/", 1),
+        ("user_client", "/category/{category.slug}/", 2),
+        ("user_client", "/profile/{user.username}/", 1),
+        ("another_user_client", "/profile/{user.username}/", 2),
+        ("user_client", "/posts/{post.id}/", 2),
+        ("another_user_client", "/posts/{post.id}/", 2),
+        ("user_client", "/posts/{post.id}/edit/", 3),
+        ("another_user_client",
+         "/posts/{post.id}/edit_comment/{comment.id}/", 2),
+        ("another_user_client",
+         "/posts/{post.id}/delete_comment/{comment.id}/", 2),
+    ],
+)
+def test_view_query_count(
+        request, django_assert_num_queries, client_name: str, url: str,
+        view_queries: int, user: Model, published_category: Model,
+        comment_by_another_user: Model
+):
+    client: Client = request.getfixturevalue(client_name)
+    url = url.format(
+        user=user,
+        category=published_category,
+        post=comment_by_another_user.post,
+        comment=comment_by_another_user,
+    )
+    if client_name != "unlogged_client":
+        view_queries += SESSION_QUERIES
+    with django_assert_num_queries(view_queries):
+        response = client.get(url)
+    assert response.status_code == 200
+
+
+def test_add_comment_query_count(
+        django_assert_num_queries, another_user_client: Client,
+        post_with_published_location: Model
+):
+    url = f"/posts/{post_with_published_location.id}/comment/"
+    # Post lookup, comment insert, the comment counter update, the lookup
+    # of page cache groups to invalidate and the outbox insert, wrapped in
+    # a savepoint (SAVEPOINT and RELEASE inside the test transaction).
+    with django_assert_num_queries(SESSION_QUERIES + 7):
+        another_user_client.post(url, data={"text": "Комментарий"})
+
+
+def test_request_object_respects_queryset(
+        rf, post_with_published_location: Model
+):
+    request = rf.get("/")
+    pk = post_with_published_location.pk
+    post = get_request_object(request, Post, pk=pk)
+    assert get_request_object(request, Post, pk=pk) is post
+    with pytest.raises(Http404):
+        get_request_object(
+            request,
+            Post.objects.filter(is_published=False),
+            pk=pk,
+        )
@@ -0,0 +1,54 @@
+import re
+
+import pytest
+from django.db import connection
+from django.db.models import Model
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+BAD_PLAN_STEPS = re.compile(r"^SCAN \w+$|USE TEMP B-TREE")
+
+
+def _explain(sql: str):
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def _assert_indexed(client: Client, url: str):
+    with CaptureQueriesContext(connection) as queries:
+        client.get(url)
+    for query in queries.captured_queries:
+        sql = query["sql"]
+        if not sql.startswith("SELECT"):
+            continue
+        bad_steps = [
+            step for step in _explain(sql) if BAD_PLAN_STEPS.search(step)
+        ]
+        assert not bad_steps, (
+            f"Убедитесь, что запрос страницы `{url}` использует индекс:"
+            f" {bad_steps} в плане запроса\n{sql}"
+        )
+
+
+@pytest.mark.parametrize("client_name", ["unlogged_client", "user_client"])
+def test_feed_query_plans(
+        request, client_name: str, mixer: Mixer,
+        many_posts_with_published_locations, published_category: Model,
+        user: Model
+):
+    client = request.getfixturevalue(client_name)
+    post = many_posts_with_published_locations[0]
+    mixer.cycle(3).blend("blog.Comment", post=post)
+    page = client.get("/").context["page_obj"]
+    for url in (
+        "/",
+        f"/?after={page.next_cursor}",
+        f"/category/{published_category.slug}/",
+        f"/profile/{user.username}/",
+        f"/posts/{post.id}/",
+    ):
+        _assert_indexed(client, url)
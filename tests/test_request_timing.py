@@ -0,0 +1,123 @@
+import logging
+import multiprocessing
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Model
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from core import metrics
+from core.timing import (
+    histogram_quantile,
+    record_request_timing,
+    request_timing_stats,
+)
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _server_timing(response):
+    return {
+        name: dict(part.split("=", 1) for part in params)
+        for name, *params in (
+            metric.strip().split(";")
+            for metric in response["Server-Timing"].split(",")
+        )
+    }
+
+
+def test_server_timing_header(
+        user_client: Client, post_with_published_location: Model
+):
+    with CaptureQueriesContext(connection) as queries:
+        response = user_client.get(f"/posts/{post_with_published_location.id}/")
+    metrics = _server_timing(response)
+    assert set(metrics) == {"db", "tpl", "view", "total"}, (
+        "Убедитесь, что ответ содержит заголовок `Server-Timing` со временем"
+        " запросов к базе, шаблонов и представления."
+    )
+    assert metrics["db"]["desc"] == f'"SQL: {len(queries)}"'
+    assert float(metrics["tpl"]["dur"]) > 0
+    assert float(metrics["total"]["dur"]) >= float(metrics["view"]["dur"])
+
+
+def test_slow_requests_are_logged(
+        settings, caplog, user_client: Client,
+        post_with_published_location: Model
+):
+    settings.SLOW_REQUEST_MS = 0
+    settings.SLOW_REQUEST_TOP_QUERIES = 2
+    with caplog.at_level(logging.WARNING, logger="core.middleware"):
+        user_client.get("/")
+    record, = caplog.records
+    assert "blog:index" in record.message
+    assert record.message.count("SELECT") == 2, (
+        "Убедитесь, что в журнал медленных запросов попадают самые"
+        " долгие SQL-запросы."
+    )
+
+
+def test_histograms(client: Client, post_with_published_location: Model):
+    for _ in range(3):
+        client.get("/")
+    client.get("/no/such/page/")
+    stats = request_timing_stats(["blog:index", "unmatched", "blog:search"])
+    assert stats["blog:index"]["count"] == 3
+    assert stats["unmatched"]["count"] == 1
+    assert "blog:search" not in stats
+    assert histogram_quantile(stats["blog:index"]["buckets"], 0.5) > 0
+    stdout = StringIO()
+    call_command("request_timing_stats", stdout=stdout)
+    assert "blog:index: запросов 3" in stdout.getvalue()
+
+
+def test_histogram_quantile():
+    buckets = {5: 50, 10: 40, 25: 9, float("inf"): 1}
+    assert histogram_quantile(buckets, 0.5) == 5
+    assert histogram_quantile(buckets, 0.9) == 10
+    assert histogram_quantile(buckets, 0.95) == 25
+
+
+def _worker_request():
+    record_request_timing("blog:index", 12)
+    metrics.flush()
+
+
+def test_histograms_are_shared_by_workers():
+    record_request_timing("blog:index", 3)
+    worker = multiprocessing.get_context("fork").Process(
+        target=_worker_request
+    )
+    worker.start()
+    worker.join()
+    assert worker.exitcode == 0
+    stats = request_timing_stats(["blog:index"])
+    assert stats["blog:index"]["count"] == 2, (
+        "Убедитесь, что распределение времени ответа собирается со всех"
+        " рабочих процессов."
+    )
+    assert stats["blog:index"]["mean_ms"] == 7.5
+
+
+def test_old_windows_are_dropped(settings):
+    settings.REQUEST_TIMING_WINDOWS = 2
+    with mock.patch("core.timing.time", return_value=0):
+        record_request_timing("blog:index", 3)
+    metrics.flush()
+    with mock.patch(
+            "core.timing.time",
+            return_value=2 * settings.REQUEST_TIMING_WINDOW,
+    ):
+        record_request_timing("blog:index", 3)
+        assert request_timing_stats(["blog:index"])["blog:index"][
+            "count"
+        ] == 1
+    windows = {
+        labels["window"] for name, labels, _ in metrics.read_metrics()
+        if name.startswith("request_timing_ms")
+    }
+    assert windows == {2}
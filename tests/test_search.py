@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+import pytest
+from django.db.models import Model
+from django.test import Client
+from django.utils import timezone
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def search_posts(mixer: Mixer, user: Model, published_category: Model):
+    def blend(title, text, **kwargs):
+        fields = {
+            "is_published": True,
+            "pub_date": timezone.now() - timedelta(days=1),
+            **kwargs,
+        }
+        return mixer.blend(
+            "blog.Post", title=title, text=text, author=user,
+            category=published_category, **fields
+        )
+
+    return {
+        "title": blend("Путешествие на Байкал", "Заметки о дороге."),
+        "text": blend("Дневник", "Мечтаю о путешествиях по Сибири."),
+        "hidden": blend("Путешествие в архив", "Снято.", is_published=False),
+        "future": blend(
+            "Путешествие в будущее", "Скоро.",
+            pub_date=timezone.now() + timedelta(days=1),
+        ),
+    }
+
+
+def _found(client: Client, query: str):
+    response = client.get("/search/", {"q": query})
+    assert response.status_code == 200
+    return [post.id for post in response.context["page_obj"]]
+
+
+def test_search_ranks_published_posts(
+        unlogged_client: Client, search_posts: dict
+):
+    found = _found(unlogged_client, "путешествия")
+    assert found == [search_posts["title"].id, search_posts["text"].id], (
+        "Убедитесь, что поиск находит разные формы слова, показывает только"
+        " опубликованные посты и ставит совпадения в заголовке выше."
+    )
+
+
+def test_empty_query(unlogged_client: Client, search_posts: dict):
+    assert _found(unlogged_client, "  ") == []
+
+
+def test_index_follows_post_changes(
+        unlogged_client: Client, search_posts: dict
+):
+    post = search_posts["title"]
+    post.title = "Поход на Алтай"
+    post.save()
+    assert post.id not in _found(unlogged_client, "Байкал")
+    assert _found(unlogged_client, "Алтая") == [post.id]
+    post.delete()
+    assert _found(unlogged_client, "Алтай") == [], (
+        "Убедитесь, что полнотекстовый индекс обновляется при изменении"
+        " и удалении публикаций."
+    )
+
+
+def test_admin_search_uses_index(admin_client: Client, search_posts: dict):
+    response = admin_client.get("/admin/blog/post/", {"q": "путешествиях"})
+    found = {post.id for post in response.context["cl"].result_list}
+    assert found == {
+        search_posts[name].id for name in ("title", "text", "hidden", "future")
+    }
@@ -0,0 +1,71 @@
+from importlib import import_module, reload
+
+from django.template import engines
+from django.test import override_settings
+
+from core.templates import precompile_templates
+
+production = import_module("blogicum.settings.production")
+development = import_module("blogicum.settings.development")
+base = import_module("blogicum.settings.base")
+
+
+def test_production_has_no_debug_tooling():
+    assert not production.DEBUG
+    assert "debug_toolbar" not in production.INSTALLED_APPS
+    assert not any(
+        "debug_toolbar" in middleware for middleware in production.MIDDLEWARE
+    ), (
+        "Убедитесь, что в настройках для продакшена нет debug_toolbar."
+    )
+    assert development.DEBUG
+    assert "debug_toolbar" in development.INSTALLED_APPS
+
+
+def test_production_templates_are_cached_and_precompiled():
+    (loader, _), = production.TEMPLATES[0]["OPTIONS"]["loaders"]
+    assert loader == "django.template.loaders.cached.Loader"
+    assert production.PRECOMPILE_TEMPLATES
+    with override_settings(TEMPLATES=production.TEMPLATES):
+        assert precompile_templates() > 0
+        cached_loader, = engines.all()[0].engine.template_loaders
+        assert "blog/index.html" in cached_loader.get_template_cache, (
+            "Убедитесь, что шаблоны из `templates/` компилируются при"
+            " запуске рабочего процесса."
+        )
+
+
+def test_production_secrets_come_from_environment(monkeypatch):
+    monkeypatch.setenv("DJANGO_SECRET_KEY", "production-secret")
+    monkeypatch.setenv(
+        "DJANGO_ALLOWED_HOSTS", "blogicum.example, www.blogicum.example"
+    )
+    settings = reload(production)
+    assert settings.SECRET_KEY == "production-secret"
+    assert settings.ALLOWED_HOSTS == [
+        "blogicum.example", "www.blogicum.example"
+    ]
+    monkeypatch.delenv("DJANGO_SECRET_KEY")
+    monkeypatch.delenv("DJANGO_ALLOWED_HOSTS")
+    settings = reload(production)
+    assert not settings.SECRET_KEY and not settings.ALLOWED_HOSTS, (
+        "Убедитесь, что в продакшене SECRET_KEY и ALLOWED_HOSTS берутся"
+        " только из переменных окружения."
+    )
+
+
+def test_runtime_files_stay_out_of_source_tree(monkeypatch, tmp_path):
+    settings = reload(base)
+    for path in (
+        settings.CACHES["default"]["LOCATION"], settings.METRICS_DB_PATH
+    ):
+        assert settings.BASE_DIR not in path.parents, (
+            "Убедитесь, что кеш и файл метрик не записываются в дерево"
+            " исходников."
+        )
+    monkeypatch.setenv("BLOGICUM_RUNTIME_DIR", str(tmp_path))
+    settings = reload(base)
+    assert settings.CACHES["default"]["LOCATION"] == tmp_path / "cache"
+    assert settings.METRICS_DB_PATH == tmp_path / "metrics.sqlite3"
+    monkeypatch.delenv("BLOGICUM_RUNTIME_DIR")
+    reload(base)
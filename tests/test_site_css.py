@@ -0,0 +1,112 @@
+import base64
+import hashlib
+import re
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.test import Client, override_settings
+
+from core.checks import check_site_css
+from core.css import parse_stylesheet, purge_css
+from core.management.commands.build_css import verify_integrity
+
+pytestmark = [pytest.mark.django_db]
+
+BOOTSTRAP = (
+    '@charset "UTF-8";/*! Bootstrap v5.2.0 | MIT License */'
+    ":root{--bs-blue:#0d6efd}*,::after{box-sizing:border-box}"
+    "body{margin:0}.container{width:100%}.navbar{display:flex}"
+    ".card{display:flex}.card-body{padding:1rem}"
+    ".form-control{display:block}.accordion-button{display:flex}"
+    ".accordion-button:not(.collapsed){color:red}"
+    ".btn-check:checked+.btn,.btn.active{color:#fff}"
+    '.breadcrumb-item+.breadcrumb-item::before{content:"{/}"}'
+    "@media (min-width:576px){.container{max-width:540px}"
+    ".accordion{width:1px}}"
+    "@keyframes spinner-border{to{transform:rotate(360deg)}}"
+    ".spinner-border{animation:.75s linear infinite spinner-border}"
+    "@keyframes progress-bar-stripes{0%{background-position-x:1rem}}"
+)
+
+
+def test_purge_css():
+    purged = purge_css(BOOTSTRAP, {"container", "card", "btn", "active"})
+    assert purged.startswith(
+        '@charset "UTF-8";/*! Bootstrap v5.2.0 | MIT License */'
+    )
+    selectors = [prelude for prelude, _ in parse_stylesheet(purged)]
+    assert selectors == [
+        '@charset "UTF-8";', ":root", "*,::after", "body", ".container",
+        ".card", ".btn.active", "@media (min-width:576px)",
+    ], (
+        "Убедитесь, что из стилей удаляются правила для классов, которых"
+        " нет в шаблонах."
+    )
+    assert "max-width:540px" in purged
+
+
+def test_purge_keeps_used_keyframes():
+    purged = purge_css(BOOTSTRAP, {"spinner-border"})
+    assert "@keyframes spinner-border" in purged
+    assert "progress-bar-stripes" not in purged
+
+
+@pytest.fixture
+def built_css(tmp_path: Path):
+    source = tmp_path / "bootstrap.min.css"
+    source.write_text(BOOTSTRAP, encoding="utf-8")
+    output = tmp_path / "static"
+    call_command(
+        "build_css", source=source, output_dir=output, stdout=None
+    )
+    return output
+
+
+def test_build_css(built_css: Path):
+    site_css = (built_css / "css/bootstrap.css").read_text()
+    critical_css = (built_css / "css/critical.css").read_text()
+    assert ".form-control{" in site_css
+    assert ".accordion-button" not in site_css
+    assert ".navbar{" in critical_css and ".card-body{" in critical_css
+    assert ".form-control" not in critical_css, (
+        "Убедитесь, что в критические стили попадают только классы"
+        " шапки и карточек публикаций."
+    )
+
+
+def test_critical_css_is_inlined(built_css: Path, client: Client):
+    with override_settings(STATICFILES_DIRS=[built_css]):
+        content = client.get("/").content.decode("utf-8")
+    style, = re.findall(r"<style>(.*?)</style>", content, re.S)
+    assert style == (built_css / "css/critical.css").read_text()
+    assert (
+        '<link rel="preload" href="/static/css/bootstrap.css" as="style"'
+    ) in content
+    assert "cdn.jsdelivr.net" not in content, (
+        "Убедитесь, что собранные стили Bootstrap отдаются с сайта,"
+        " а не из CDN."
+    )
+
+
+def test_cdn_until_css_is_built(client: Client, tmp_path: Path):
+    with override_settings(STATICFILES_DIRS=[tmp_path]):
+        content = client.get("/").content.decode("utf-8")
+        assert [error.id for error in check_site_css(None)] == [
+            "core.E001"
+        ], (
+            "Убедитесь, что check --deploy сообщает об отсутствии"
+            " собранных стилей."
+        )
+    assert "cdn.jsdelivr.net" in content, (
+        "Убедитесь, что без собранных стилей страницы подключают"
+        " Bootstrap из CDN."
+    )
+    assert "<style>" not in content
+
+
+def test_verify_integrity():
+    content = b"body{margin:0}"
+    digest = base64.b64encode(hashlib.sha384(content).digest()).decode()
+    assert verify_integrity(content, f"sha384-{digest}")
+    assert not verify_integrity(content + b" ", f"sha384-{digest}")
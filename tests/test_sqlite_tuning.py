@@ -0,0 +1,42 @@
+import sqlite3
+
+import pytest
+from django.conf import settings
+from django.db import connection
+
+from core.db import apply_sqlite_pragmas, sqlite_connection_is_alive
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.mark.parametrize(
+    "pragma, expected",
+    [
+        ("synchronous", 1),
+        ("temp_store", 2),
+        ("busy_timeout", settings.SQLITE_PRAGMAS["busy_timeout"]),
+        ("cache_size", settings.SQLITE_PRAGMAS["cache_size"]),
+    ],
+)
+def test_connection_pragmas(pragma: str, expected: int):
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA {pragma}")
+        assert cursor.fetchone()[0] == expected, (
+            f"Убедитесь, что при открытии соединения с SQLite выполняется"
+            f" `PRAGMA {pragma}` из настройки `SQLITE_PRAGMAS`."
+        )
+
+
+def test_wal_journal_mode(tmp_path):
+    raw_connection = sqlite3.connect(tmp_path / "db.sqlite3")
+    apply_sqlite_pragmas(raw_connection, settings.SQLITE_PRAGMAS)
+    mode = raw_connection.execute("PRAGMA journal_mode").fetchone()[0]
+    raw_connection.close()
+    assert mode == "wal"
+
+
+def test_health_check_detects_closed_connection():
+    raw_connection = sqlite3.connect(":memory:")
+    assert sqlite_connection_is_alive(raw_connection)
+    raw_connection.close()
+    assert not sqlite_connection_is_alive(raw_connection)
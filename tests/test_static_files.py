@@ -0,0 +1,86 @@
+import gzip
+import re
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.test import Client, override_settings
+
+from core.staticfiles import accepted_encodings
+
+pytestmark = [pytest.mark.django_db]
+
+STORAGE = "core.staticfiles.CompressedManifestStaticFilesStorage"
+
+
+@pytest.fixture
+def static_root(tmp_path: Path):
+    with override_settings(STATIC_ROOT=tmp_path, STATICFILES_STORAGE=STORAGE):
+        call_command("collectstatic", interactive=False, verbosity=0)
+        yield tmp_path
+
+
+def _hashed_favicon(client: Client):
+    content = client.get("/").content.decode("utf-8")
+    url, = re.findall(r"/static/img/fav/favicon\.[0-9a-f]{12}\.ico", content)
+    return url
+
+
+def test_collectstatic_writes_hashed_and_compressed_files(static_root: Path):
+    favicons = {path.name for path in (static_root / "img/fav").iterdir()}
+    hashed, = [
+        name for name in favicons
+        if re.fullmatch(r"favicon\.[0-9a-f]{12}\.ico", name)
+    ]
+    assert f"{hashed}.gz" in favicons, (
+        "Убедитесь, что `collectstatic` создаёт сжатые варианты файлов"
+        " с хешем содержимого в имени."
+    )
+    assert not any(name.endswith(".png.gz") for name in favicons)
+
+
+def test_hashed_file_is_served_compressed(static_root: Path):
+    client = Client()
+    url = _hashed_favicon(client)
+    response = client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+    assert response.status_code == 200
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert response["Vary"] == "Accept-Encoding"
+    original = (static_root / url[len("/static/"):]).read_bytes()
+    assert gzip.decompress(b"".join(response.streaming_content)) == original
+
+    response = client.get(url)
+    assert "Content-Encoding" not in response
+    assert b"".join(response.streaming_content) == original
+    assert client.get(
+        url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+    ).status_code == 304
+
+
+def test_brotli_is_preferred(static_root: Path):
+    (static_root / "robots.txt").write_text("User-agent: *\n")
+    (static_root / "robots.txt.gz").write_bytes(b"gzip")
+    (static_root / "robots.txt.br").write_bytes(b"brotli")
+    client = Client()
+    response = client.get(
+        "/static/robots.txt", HTTP_ACCEPT_ENCODING="gzip, br"
+    )
+    assert response["Content-Encoding"] == "br"
+    assert response["Cache-Control"] == "public, max-age=60", (
+        "Убедитесь, что файлы без хеша в имени не кешируются надолго."
+    )
+    response = client.get(
+        "/static/robots.txt", HTTP_ACCEPT_ENCODING="gzip, br;q=0"
+    )
+    assert response["Content-Encoding"] == "gzip"
+
+
+def test_missing_static_file(static_root: Path):
+    assert Client().get("/static/img/missing.png").status_code == 404
+
+
+def test_accepted_encodings():
+    assert accepted_encodings("gzip, deflate, br") == {"gzip", "deflate", "br"}
+    assert accepted_encodings("br;q=0, GZIP;q=0.5") == {"gzip"}
+    assert accepted_encodings("") == set()
@@ -0,0 +1,103 @@
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.contrib.sessions.models import Session
+from django.db.models import Model
+from django.test import Client
+
+from blog.models import User
+from core import auth as auth_cache
+
+pytestmark = [pytest.mark.django_db]
+
+URL = "/pages/about/"
+
+
+def test_session_and_user_cost_no_queries(
+        django_assert_num_queries, user_client: Client
+):
+    with django_assert_num_queries(1):
+        user_client.get(URL)
+    with django_assert_num_queries(0):
+        response = user_client.get(URL)
+    assert response.context["user"].is_authenticated, (
+        "Убедитесь, что пользователь берётся из кеша рабочего процесса,"
+        " а сессия не читается из базы данных."
+    )
+    assert not Session.objects.exists()
+
+
+def test_anonymous_request_costs_no_queries(
+        django_assert_num_queries, client: Client
+):
+    with django_assert_num_queries(0):
+        response = client.get(URL)
+    assert not response.context["user"].is_authenticated
+
+
+def test_profile_update_refreshes_user(user_client: Client, user: Model):
+    user_client.get(URL)
+    user_client.post("/edit_profile/", data={
+        "first_name": "Новое имя",
+        "last_name": user.last_name,
+        "username": user.username,
+        "email": "new@example.com",
+    })
+    assert user_client.get(URL).context["user"].first_name == "Новое имя", (
+        "Убедитесь, что кеш пользователя сбрасывается при изменении профиля."
+    )
+
+
+def test_invalid_profile_form_does_not_leak_into_cache(
+        user_client: Client, user: Model
+):
+    user_client.get(URL)
+    user_client.post("/edit_profile/", data={
+        "first_name": "Черновик",
+        "username": "",
+    })
+    assert user_client.get(URL).context["user"].first_name == user.first_name
+
+
+def test_password_change_keeps_session(user_client: Client, user: Model):
+    user.set_password("old-password-1")
+    user.save()
+    user_client.force_login(user)
+    user_client.get(URL)
+    user_client.post("/auth/password_change/", data={
+        "old_password": "old-password-1",
+        "new_password1": "Kx9-new-password",
+        "new_password2": "Kx9-new-password",
+    })
+    current = user_client.get(URL).context["user"]
+    assert current.is_authenticated
+    assert current.check_password("Kx9-new-password")
+
+
+@pytest.mark.parametrize("change", ["password", "deactivation"])
+def test_change_in_another_worker_drops_cached_user(
+        change: str, user_client: Client, user: Model
+):
+    user_client.get(URL)
+    # The other worker saves the user; this one keeps its own entry.
+    entries = dict(auth_cache._users)
+    if change == "password":
+        user.set_password("Kx9-other-password")
+    else:
+        user.is_active = False
+    user.save()
+    auth_cache._users.update(entries)
+    assert not user_client.get(URL).context["user"].is_authenticated, (
+        "Убедитесь, что пользователь, изменённый в другом рабочем процессе,"
+        " не берётся из кеша."
+    )
+
+
+def test_cached_user_expires(settings, user_client: Client, user: Model):
+    user_client.get(URL)
+    # An update without signals leaves the version token as it is.
+    User.objects.filter(pk=user.pk).update(password=make_password("other"))
+    assert user_client.get(URL).context["user"].is_authenticated
+    settings.USER_CACHE_TIMEOUT = 0
+    assert not user_client.get(URL).context["user"].is_authenticated, (
+        "Убедитесь, что пользователь хранится в кеше ограниченное время."
+    )